@@ -1,7 +1,16 @@
 """Package initialisation."""
 
-from advent_of_code._version import __version__
-
 __all__ = [
     "__version__",
 ]
+
+
+def __getattr__(name: str):
+    # Resolve the version lazily; reading package metadata is slow, and most
+    # CLI invocations never need it
+    if name == "__version__":
+        # pylint: disable=import-outside-toplevel
+        from advent_of_code._version import __version__
+
+        return __version__
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,13 +1,6 @@
 """CLI entrypoint."""
 
-from advent_of_code import _cli, _version
-from advent_of_code.day01 import day01
-from advent_of_code.day02 import day02
-from advent_of_code.day03 import day03
-from advent_of_code.day04 import day04
-from advent_of_code.day05 import day05
-from advent_of_code.day06 import day06
-from advent_of_code.day07 import day07
+from advent_of_code import _cli, _registry
 
 
 def main():
@@ -17,35 +10,32 @@ def main():
     args = _cli.parse_args(parser)
 
     if args.version:
+        # pylint: disable=import-outside-toplevel
+        from advent_of_code import _version
+
         print(_version.version_info())
         return
 
-    if not args.day:
-        raise ValueError("No day specified")
+    if args.no_cache:
+        # pylint: disable=import-outside-toplevel
+        from advent_of_code import cache
 
-    if args.day == 1:
-        day01.main()
-        return
-    if args.day == 2:
-        day02.main()
-        return
-    if args.day == 3:
-        day03.main()
-        return
-    if args.day == 4:
-        day04.main()
-        return
-    if args.day == 5:
-        day05.main()
-        return
-    if args.day == 6:
-        day06.main()
-        return
-    if args.day == 7:
-        day07.main()
+        cache.disable_cache()
+
+    if args.day == _cli.ALL_DAYS or args.days:
+        # pylint: disable=import-outside-toplevel
+        from advent_of_code import _runner
+
+        days = _registry.available_days() if args.day == _cli.ALL_DAYS else args.days
+        results = _runner.run_solvers(_registry.solvers_for_days(days), args.jobs)
+        _runner.print_results(results)
         return
 
-    raise IndexError("No solution for specified day yet")
+    if not args.day:
+        raise ValueError("No day specified")
+
+    # Only the module for the requested day is imported
+    _registry.get_day_main(args.day)()
 
 
 if __name__ == "__main__":
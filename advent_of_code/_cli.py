@@ -3,6 +3,27 @@
 from __future__ import annotations
 
 import argparse
+from typing import List, Union
+
+ALL_DAYS = "all"
+
+
+def day_argument(value: str) -> Union[int, str]:
+    """Parse the value of the `--day` argument: a day number, or "all"."""
+    if value == ALL_DAYS:
+        return value
+    try:
+        return int(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(f"invalid day: {value!r}") from exc
+
+
+def days_argument(value: str) -> List[int]:
+    """Parse the value of the `--days` argument: comma-separated day numbers."""
+    try:
+        return [int(day) for day in value.split(",") if day.strip()]
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(f"invalid list of days: {value!r}") from exc
 
 
 def arg_parser() -> argparse.ArgumentParser:
@@ -22,8 +43,31 @@ def arg_parser() -> argparse.ArgumentParser:
         "--day",
         "-d",
         dest="day",
+        type=day_argument,
+        help='Specify which day to display the solution to, or "all" to run every day.',
+    )
+
+    parser.add_argument(
+        "--days",
+        dest="days",
+        type=days_argument,
+        help="Comma-separated list of days to run in parallel, e.g. 1,4,6.",
+    )
+
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        dest="jobs",
         type=int,
-        help="Specify which day to display the solution to.",
+        help="Number of worker processes when running several days. "
+        "Defaults to the number of CPUs.",
+    )
+
+    parser.add_argument(
+        "--no-cache",
+        dest="no_cache",
+        action="store_true",
+        help="Parse puzzle inputs from scratch instead of using the parsed input cache.",
     )
 
     return parser
@@ -0,0 +1,96 @@
+"""Registry of the daily solvers.
+
+Each day lives in a `dayNN` package containing a `dayNN` module. The module
+is expected to define `main()` (print both answers), plus `part_one()` and
+`part_two()` (return the answers). Days are discovered by scanning the package
+directory, and their modules are only imported when a solver is loaded.
+"""
+
+from __future__ import annotations
+
+import importlib
+import os
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List, Tuple
+
+PACKAGE_NAME = "advent_of_code"
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+DAY_PACKAGE_REGEX = re.compile(r"^day(\d{2})$")
+PART_ENTRYPOINTS = {1: "part_one", 2: "part_two"}
+MAIN_ENTRYPOINT = "main"
+
+
+@dataclass(frozen=True)
+class SolverEntry:
+    """A lazily imported solver entrypoint."""
+
+    day: int
+    part: int
+    module_name: str
+    attribute: str
+
+    def load(self) -> Callable:
+        """Import the module for this solver and return its entrypoint."""
+        module = importlib.import_module(self.module_name)
+        return getattr(module, self.attribute)
+
+
+def day_module_name(day: int) -> str:
+    """Return the fully-qualified name of the module that solves `day`."""
+    return f"{PACKAGE_NAME}.day{day:02d}.day{day:02d}"
+
+
+@lru_cache(maxsize=None)
+def available_days() -> Tuple[int, ...]:
+    """Return every day with a solution module, in ascending order."""
+    days = []
+    with os.scandir(PACKAGE_DIR) as entries:
+        for entry in entries:
+            match = DAY_PACKAGE_REGEX.match(entry.name)
+            if not (match and entry.is_dir()):
+                continue
+            if os.path.isfile(os.path.join(entry.path, f"{entry.name}.py")):
+                days.append(int(match.group(1)))
+    return tuple(sorted(days))
+
+
+@lru_cache(maxsize=None)
+def solver_registry() -> Dict[Tuple[int, int], SolverEntry]:
+    """Return a mapping of (day, part) to the entry that solves it."""
+    registry = {}
+    for day in available_days():
+        for part, attribute in PART_ENTRYPOINTS.items():
+            registry[(day, part)] = SolverEntry(day, part, day_module_name(day), attribute)
+    return registry
+
+
+def get_solver(day: int, part: int) -> SolverEntry:
+    """Return the solver entry for the given day and part.
+
+    Raises an IndexError if there is no solution for that day and part yet.
+    """
+    try:
+        return solver_registry()[(day, part)]
+    except KeyError as exc:
+        raise IndexError(f"No solution for day {day}, part {part} yet") from exc
+
+
+def get_day_main(day: int) -> Callable[[], None]:
+    """Return the `main()` function of the module that solves `day`.
+
+    Raises an IndexError if there is no solution for that day yet.
+    """
+    if day not in available_days():
+        raise IndexError("No solution for specified day yet")
+    return SolverEntry(day, 0, day_module_name(day), MAIN_ENTRYPOINT).load()
+
+
+def solvers_for_days(days: Iterable[int]) -> List[SolverEntry]:
+    """Return the solver entries for every part of the given days, ordered by
+    day and then by part.
+
+    Raises an IndexError if any of the days has no solution yet.
+    """
+    return [get_solver(day, part) for day in sorted(set(days)) for part in PART_ENTRYPOINTS]
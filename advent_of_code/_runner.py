@@ -0,0 +1,54 @@
+"""Run several solvers at once across a pool of worker processes."""
+
+from __future__ import annotations
+
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+
+from advent_of_code import util
+from advent_of_code._registry import SolverEntry
+
+
+@dataclass(frozen=True)
+class SolverResult:
+    """The answer returned by a solver, and how long it took to compute."""
+
+    day: int
+    part: int
+    answer: int
+    elapsed: float
+
+
+def run_solver(entry: SolverEntry) -> SolverResult:
+    """Load and run a single solver, timing how long it takes."""
+    solver = entry.load()
+    start = time.perf_counter()
+    answer = solver()
+    elapsed = time.perf_counter() - start
+    return SolverResult(entry.day, entry.part, answer, elapsed)
+
+
+def run_solvers(entries: Sequence[SolverEntry], jobs: Optional[int] = None) -> List[SolverResult]:
+    """Run every solver in `entries` in a pool of `jobs` worker processes.
+
+    Each part of each day is submitted as its own task, so the slow solvers
+    (e.g. day 6 part 2, day 7 part 2) run alongside each other rather than one
+    after the other. Results are returned in the same order as `entries`.
+
+    Args:
+        entries (Sequence[SolverEntry]): Solvers to run
+        jobs (Optional[int]): Number of worker processes. Defaults to the
+        number of CPUs.
+    """
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = [executor.submit(run_solver, entry) for entry in entries]
+        return [future.result() for future in futures]
+
+
+def print_results(results: Sequence[SolverResult]) -> None:
+    """Print the answer and timing of each solver result."""
+    for result in results:
+        util.print_output_string(result.day, result.part)
+        print(f"{result.answer} ({result.elapsed:.3f}s)")
@@ -1,13 +1,12 @@
 """CLI Versioning."""
 
+from importlib.metadata import PackageNotFoundError, version
 from typing import Optional
 
-from pkg_resources import DistributionNotFound, get_distribution
-
 __version__: Optional[str]
 try:
-    __version__ = get_distribution(__package__).version
-except DistributionNotFound:
+    __version__ = version(__package__)
+except PackageNotFoundError:
     __version__ = None
 
 
@@ -0,0 +1,4 @@
+"""Benchmark suite for the Advent of Code 2024 solvers.
+
+Run with `python -m advent_of_code.bench --help` for usage.
+"""
@@ -0,0 +1,106 @@
+"""Benchmark entrypoint: `python -m advent_of_code.bench`."""
+
+import argparse
+import fnmatch
+import json
+import platform
+import sys
+import tempfile
+from typing import List
+
+from advent_of_code import cache
+from advent_of_code.bench.cases import BENCH_CASES
+from advent_of_code.bench.runner import run_benchmarks
+
+DEFAULT_SCALES = "1,10,100"
+DEFAULT_REPEAT = 5
+
+
+def arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="advent-of-code-bench",
+        description="Benchmark the Advent of Code 2024 solvers on generated inputs",
+    )
+    parser.add_argument(
+        "--cases",
+        "-c",
+        dest="cases",
+        default="*",
+        help='Glob pattern selecting which cases to run, e.g. "day03.*". Defaults to all.',
+    )
+    parser.add_argument(
+        "--scales",
+        "-s",
+        dest="scales",
+        default=DEFAULT_SCALES,
+        help=f"Comma-separated input size multipliers. Defaults to {DEFAULT_SCALES}.",
+    )
+    parser.add_argument(
+        "--repeat",
+        "-r",
+        dest="repeat",
+        type=int,
+        default=DEFAULT_REPEAT,
+        help=f"Timed repetitions per case and scale. Defaults to {DEFAULT_REPEAT}.",
+    )
+    parser.add_argument(
+        "--seed",
+        dest="seed",
+        type=int,
+        default=0,
+        help="Seed for the input generators.",
+    )
+    parser.add_argument(
+        "--cache",
+        dest="cache",
+        action="store_true",
+        help="Use the parsed input cache. By default every run parses its input.",
+    )
+    parser.add_argument(
+        "--list",
+        dest="list",
+        action="store_true",
+        help="List the available cases and exit.",
+    )
+    parser.add_argument(
+        "--output",
+        "-o",
+        dest="output",
+        help="Write the JSON report to this file instead of stdout.",
+    )
+    return parser
+
+
+def main(argv: List[str] = None) -> None:
+    """Run the benchmarks and write a JSON report."""
+    args = arg_parser().parse_args(argv)
+    cases = [case for case in BENCH_CASES if fnmatch.fnmatch(case.name, args.cases)]
+
+    if args.list:
+        for case in cases:
+            print(case.name)
+        return
+
+    if not args.cache:
+        cache.disable_cache()
+
+    scales = [int(scale) for scale in args.scales.split(",")]
+    with tempfile.TemporaryDirectory(prefix="advent_of_code_bench_") as workdir:
+        results = run_benchmarks(cases, scales, args.repeat, workdir, args.seed)
+
+    report = {
+        "python": sys.version,
+        "platform": platform.platform(),
+        "seed": args.seed,
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+            file.write("\n")
+    else:
+        print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""Benchmark cases: which solver to time, and on which generated input."""
+
+import os
+from dataclasses import dataclass
+from typing import Any, Callable, List, Optional
+
+from advent_of_code.bench import generators
+from advent_of_code.day01.day01 import HistorianList
+from advent_of_code.day02.day02 import count_safe_reports
+from advent_of_code.day03 import day03
+from advent_of_code.day04 import flat
+from advent_of_code.day04.common import wordsearch_file_to_array
+from advent_of_code.day04.part1 import count_xmas_in_wordsearch
+from advent_of_code.day04.part2 import count_x_shaped_mas_in_wordsearch
+from advent_of_code.day05.day05 import ProblemInput
+from advent_of_code.day06.day06 import MapArea
+from advent_of_code.day07 import part1 as day07_part1
+from advent_of_code.day07 import part2 as day07_part2
+from advent_of_code.util import read_input
+
+# Largest scale the day 6 part two case is run at
+DAY06_MAX_SCALE = 1
+
+
+def write_input(contents: str, directory: str, filename: str) -> str:
+    """Write a generated input to `directory` and return its path."""
+    filepath = os.path.join(directory, filename)
+    with open(filepath, "w", encoding="utf-8") as file:
+        file.write(contents)
+    return filepath
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+@dataclass(frozen=True)
+class BenchCase:
+    """A solver to benchmark.
+
+    `generator` produces the input contents for a given scale, `prepare` turns
+    the path to the written input into the solver's argument (untimed, run
+    before every repetition), and `run` is the timed solver call. Scales above
+    `max_scale` are skipped for this case.
+    """
+
+    name: str
+    generator: Callable
+    run: Callable[[Any], Any]
+    prepare: Callable[[str], Any] = _identity
+    max_scale: Optional[int] = None
+
+    def runs_at(self, scale: int) -> bool:
+        """Return True if this case should be timed at the given scale."""
+        return self.max_scale is None or scale <= self.max_scale
+
+
+def _historian_list(filepath: str) -> Any:
+    historian_list = HistorianList(filepath)
+    return historian_list.distance, historian_list.similarity
+
+
+def _read(filepath: str) -> str:
+    with open(filepath, encoding="utf-8") as file:
+        return file.read()
+
+
+def _map_area_part_two(map_area: MapArea) -> int:
+    map_area.solve_part_two(False)
+    return map_area.good_obstacle_positions
+
+
+BENCH_CASES: List[BenchCase] = [
+    BenchCase("day01.HistorianList", generators.generate_day01, _historian_list),
+    BenchCase("day02.count_safe_reports", generators.generate_day02, count_safe_reports),
+    BenchCase(
+        "day02.count_safe_reports.allow_bad_level",
+        generators.generate_day02,
+        lambda filepath: count_safe_reports(filepath, True),
+    ),
+    BenchCase(
+        "day03.find_and_multiply_all_mul_strings",
+        generators.generate_day03,
+        day03.find_and_multiply_all_mul_strings,
+        _read,
+    ),
+    BenchCase(
+        "day03.find_and_multiply_all_mul_strings.bytes",
+        generators.generate_day03,
+        lambda input_str: day03.find_and_multiply_all_mul_strings(input_str, day03.BYTES_ENGINE),
+        _read,
+    ),
+    BenchCase("day03.solve_part_two", generators.generate_day03, day03.solve_part_two, _read),
+    BenchCase(
+        "day04.count_xmas_in_wordsearch",
+        generators.generate_day04,
+        count_xmas_in_wordsearch,
+        wordsearch_file_to_array,
+    ),
+    BenchCase(
+        "day04.flat.count_word_in_grid",
+        generators.generate_day04,
+        lambda grid: flat.count_word_in_grid(grid, "XMAS"),
+        lambda filepath: read_input(filepath).grid(),
+    ),
+    BenchCase(
+        "day04.count_x_shaped_mas_in_wordsearch",
+        generators.generate_day04,
+        count_x_shaped_mas_in_wordsearch,
+        wordsearch_file_to_array,
+    ),
+    BenchCase(
+        "day04.flat.count_x_shaped_mas_in_grid",
+        generators.generate_day04,
+        flat.count_x_shaped_mas_in_grid,
+        lambda filepath: read_input(filepath).grid(),
+    ),
+    # Parsing checks every update against the rules, so it is timed too
+    BenchCase(
+        "day05.ProblemInput.solve_part_one",
+        generators.generate_day05,
+        lambda contents: ProblemInput(contents).solve_part_one(),
+        _read,
+    ),
+    BenchCase(
+        "day05.ProblemInput.solve_part_two",
+        generators.generate_day05,
+        lambda contents: ProblemInput(contents).solve_part_two(),
+        _read,
+    ),
+    # Tries an obstruction at every visited cell, each needing a full traversal,
+    # and traversals give up after a fixed number of steps, so larger maps take
+    # far too long and would not measure the same work
+    BenchCase(
+        "day06.MapArea.solve_part_two",
+        generators.generate_day06,
+        _map_area_part_two,
+        MapArea,
+        max_scale=DAY06_MAX_SCALE,
+    ),
+    BenchCase("day07.solve_part_one", generators.generate_day07, day07_part1.solve_part_one),
+    BenchCase("day07.solve_part_two", generators.generate_day07, day07_part2.solve_part_two),
+]
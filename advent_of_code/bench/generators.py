@@ -0,0 +1,127 @@
+"""Synthetic puzzle input generators for the benchmark suite.
+
+Each generator takes a `scale` (1 produces an input about the size of the real
+puzzle input) and a seeded `random.Random`, and returns the input as a string
+in the same format as the real puzzle input. Line-based inputs grow linearly
+with `scale`; grid inputs grow in area.
+"""
+
+import math
+import random
+from typing import List
+
+DAY01_LINES = 1000
+DAY02_REPORTS = 1000
+DAY03_LINES = 6
+DAY03_INSTRUCTIONS_PER_LINE = 300
+DAY04_SIDE = 140
+DAY05_PAGES = 49
+DAY05_UPDATES = 200
+DAY06_SIDE = 130
+DAY06_OBSTRUCTION_PROBABILITY = 0.05
+DAY07_EQUATIONS = 850
+
+
+def scaled_side(side: int, scale: int) -> int:
+    """Return the side length of a square grid with `scale` times the area of
+    a grid with the given side length.
+    """
+    return max(1, round(side * math.sqrt(scale)))
+
+
+def generate_day01(scale: int, rng: random.Random) -> str:
+    """Two columns of five-digit location IDs."""
+    lines = []
+    for _ in range(DAY01_LINES * scale):
+        lines.append(f"{rng.randint(10000, 99999)}   {rng.randint(10000, 99999)}")
+    return "\n".join(lines) + "\n"
+
+
+def generate_day02(scale: int, rng: random.Random) -> str:
+    """Reports of 5-8 levels, mostly monotonic, some with a bad level."""
+    lines = []
+    for _ in range(DAY02_REPORTS * scale):
+        direction = rng.choice((-1, 1))
+        levels = [rng.randint(10, 90)]
+        for _ in range(rng.randint(4, 7)):
+            levels.append(levels[-1] + direction * rng.randint(1, 3))
+        if rng.random() < 0.5:
+            levels[rng.randrange(len(levels))] += rng.randint(-4, 4)
+        lines.append(" ".join(str(level) for level in levels))
+    return "\n".join(lines) + "\n"
+
+
+def generate_day03(scale: int, rng: random.Random) -> str:
+    """Corrupted memory containing valid and invalid instructions."""
+    fragments = [
+        lambda: f"mul({rng.randint(1, 999)},{rng.randint(1, 999)})",
+        lambda: f"mul({rng.randint(1, 999)},{rng.randint(1, 999)}]",
+        lambda: f"mul ( {rng.randint(1, 999)},{rng.randint(1, 999)})",
+        lambda: "do()",
+        lambda: "don't()",
+        lambda: "".join(rng.choices("#$%&'()*+,-./:;<=>?@[]^_{|}~ from what why", k=8)),
+    ]
+    weights = [6, 1, 1, 1, 1, 6]
+    lines = []
+    for _ in range(DAY03_LINES * scale):
+        chosen = rng.choices(fragments, weights, k=DAY03_INSTRUCTIONS_PER_LINE)
+        lines.append("".join(fragment() for fragment in chosen))
+    return "\n".join(lines) + "\n"
+
+
+def generate_day04(scale: int, rng: random.Random) -> str:
+    """A square word search made of the letters X, M, A and S."""
+    side = scaled_side(DAY04_SIDE, scale)
+    rows = ["".join(rng.choices("XMAS", k=side)) for _ in range(side)]
+    return "\n".join(rows) + "\n"
+
+
+def generate_day05(scale: int, rng: random.Random) -> str:
+    """Ordering rules for every pair of pages, followed by updates.
+
+    About half of the updates are correctly ordered.
+    """
+    pages = rng.sample(range(10, 100), DAY05_PAGES)
+    rules = [f"{pages[i]}|{pages[j]}" for i in range(len(pages)) for j in range(i + 1, len(pages))]
+    rng.shuffle(rules)
+    rank = {page: idx for idx, page in enumerate(pages)}
+    updates = []
+    for _ in range(DAY05_UPDATES * scale):
+        update: List[int] = rng.sample(pages, rng.randrange(5, 24, 2))
+        if rng.random() < 0.5:
+            update.sort(key=rank.__getitem__)
+        updates.append(",".join(str(page) for page in update))
+    return "\n".join(rules) + "\n\n" + "\n".join(updates)
+
+
+def generate_day06(scale: int, rng: random.Random) -> str:
+    """A map area with scattered obstructions and the guard facing up near
+    the centre.
+    """
+    side = scaled_side(DAY06_SIDE, scale)
+    grid = [
+        ["#" if rng.random() < DAY06_OBSTRUCTION_PROBABILITY else "." for _ in range(side)]
+        for _ in range(side)
+    ]
+    grid[side // 2][side // 2] = "^"
+    return "\n".join("".join(row) for row in grid) + "\n"
+
+
+def generate_day07(scale: int, rng: random.Random) -> str:
+    """Calibration equations, about half of which can be made true."""
+    lines = []
+    for _ in range(DAY07_EQUATIONS * scale):
+        values = [rng.randint(1, 99) for _ in range(rng.randint(2, 9))]
+        test_value = values[0]
+        for value in values[1:]:
+            operation = rng.randrange(3)
+            if operation == 0:
+                test_value += value
+            elif operation == 1:
+                test_value *= value
+            else:
+                test_value = int(f"{test_value}{value}")
+        if rng.random() < 0.5:
+            test_value += rng.randint(1, 9)
+        lines.append(f"{test_value}: " + " ".join(str(value) for value in values))
+    return "\n".join(lines) + "\n"
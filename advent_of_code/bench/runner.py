@@ -0,0 +1,77 @@
+"""Time benchmark cases and summarise the results."""
+
+import math
+import os
+import random
+import statistics
+import time
+import tracemalloc
+from typing import Dict, List, Sequence
+
+from advent_of_code.bench.cases import BenchCase, write_input
+
+
+def percentile(timings: Sequence[float], fraction: float) -> float:
+    """Return the `fraction` percentile of `timings`, using the nearest-rank
+    method.
+    """
+    ordered = sorted(timings)
+    rank = max(1, math.ceil(fraction * len(ordered)))
+    return ordered[rank - 1]
+
+
+def time_case(case: BenchCase, filepath: str, repeat: int) -> Dict:
+    """Run `case` against the input at `filepath` `repeat` times, and once more
+    under tracemalloc to measure peak memory.
+    """
+    timings = []
+    for _ in range(repeat):
+        argument = case.prepare(filepath)
+        start = time.perf_counter()
+        case.run(argument)
+        timings.append(time.perf_counter() - start)
+
+    # Measured separately, since tracing allocations slows the solver down
+    argument = case.prepare(filepath)
+    tracemalloc.start()
+    try:
+        case.run(argument)
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "min_s": min(timings),
+        "median_s": statistics.median(timings),
+        "p95_s": percentile(timings, 0.95),
+        "peak_memory_bytes": peak_memory,
+    }
+
+
+def run_benchmarks(
+    cases: Sequence[BenchCase],
+    scales: Sequence[int],
+    repeat: int,
+    workdir: str,
+    seed: int = 0,
+) -> List[Dict]:
+    """Generate inputs for every case and scale in `workdir`, time each case,
+    and return one result per case and scale. Scales above a case's
+    `max_scale` are skipped.
+    """
+    results = []
+    for case in cases:
+        for scale in scales:
+            if not case.runs_at(scale):
+                continue
+            contents = case.generator(scale, random.Random(seed))
+            filepath = write_input(contents, workdir, f"{case.name}.x{scale}.txt")
+            result = {
+                "case": case.name,
+                "scale": scale,
+                "input_bytes": os.path.getsize(filepath),
+                "repeat": repeat,
+            }
+            result.update(time_case(case, filepath, repeat))
+            results.append(result)
+    return results
@@ -0,0 +1,229 @@
+"""On-disk cache of parsed puzzle inputs.
+
+Parsed inputs are stored as a list of typed `array.array`s in a compact binary
+file, keyed by the input's path, the parser that produced them and a hash of
+the input's contents. Editing an input therefore invalidates its entry. The
+least recently used entries are evicted once the cache exceeds its size limit.
+
+Set the `ADVENT_OF_CODE_NO_CACHE` environment variable (or call
+`disable_cache()`) to bypass the cache, and `ADVENT_OF_CODE_CACHE_DIR` to
+change where it is stored.
+"""
+
+import hashlib
+import os
+import struct
+import tempfile
+from array import array
+from typing import Callable, List, Optional, Sequence
+
+from advent_of_code.util import InputData, read_input
+
+CACHE_DIR_ENV = "ADVENT_OF_CODE_CACHE_DIR"
+NO_CACHE_ENV = "ADVENT_OF_CODE_NO_CACHE"
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+ENTRY_SUFFIX = ".bin"
+
+MAGIC = b"AOCC"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<4sHI")
+ARRAY_HEADER = struct.Struct("<cQ")
+
+
+def cache_enabled() -> bool:
+    """Return True unless the cache has been disabled."""
+    return not os.environ.get(NO_CACHE_ENV)
+
+
+def disable_cache() -> None:
+    """Disable the cache for this process and any worker processes it starts."""
+    os.environ[NO_CACHE_ENV] = "1"
+
+
+def default_cache_dir() -> str:
+    """Return the directory the cache is stored in."""
+    if os.environ.get(CACHE_DIR_ENV):
+        return os.environ[CACHE_DIR_ENV]
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "advent_of_code")
+
+
+class ParsedInputCache:
+    """A size-bounded, least-recently-used store of parsed inputs."""
+
+    def __init__(self, directory: Optional[str] = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = directory or default_cache_dir()
+        self.max_bytes = max_bytes
+
+    @staticmethod
+    def key(filepath: str, contents: bytes, parser: str) -> str:
+        """Return the cache key for `contents` read from `filepath` and parsed
+        by `parser`.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(os.path.abspath(filepath).encode("utf-8") + b"\0")
+        digest.update(parser.encode("utf-8") + b"\0")
+        digest.update(hashlib.blake2b(contents, digest_size=16).digest())
+        return digest.hexdigest()
+
+    def entry_path(self, key: str) -> str:
+        """Return the path of the file storing the entry for `key`."""
+        return os.path.join(self.directory, key + ENTRY_SUFFIX)
+
+    def load(self, key: str) -> Optional[List[array]]:
+        """Return the arrays stored for `key`, or None if there is no valid
+        entry.
+        """
+        path = self.entry_path(key)
+        try:
+            with open(path, "rb") as file:
+                data = file.read()
+            arrays = decode_arrays(data)
+            # Mark this entry as recently used
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        return arrays
+
+    def store(self, key: str, arrays: Sequence[array]) -> None:
+        """Store `arrays` for `key`, then evict old entries if the cache is
+        over its size limit.
+
+        The entry is written to a temporary file and renamed into place, so
+        concurrent readers never see a partial entry.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(encode_arrays(arrays))
+            os.replace(tmp_path, self.entry_path(key))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        self.evict()
+
+    def evict(self) -> None:
+        """Remove the least recently used entries until the cache is no
+        larger than `self.max_bytes`.
+        """
+        entries = []
+        with os.scandir(self.directory) as dir_entries:
+            for entry in dir_entries:
+                if not entry.name.endswith(ENTRY_SUFFIX):
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    # Evicted by another process
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_size <= self.max_bytes:
+                break
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            total_size -= size
+
+
+def encode_arrays(arrays: Sequence[array]) -> bytes:
+    """Serialise a sequence of arrays to bytes."""
+    parts = [HEADER.pack(MAGIC, FORMAT_VERSION, len(arrays))]
+    for arr in arrays:
+        parts.append(ARRAY_HEADER.pack(arr.typecode.encode("ascii"), len(arr)))
+        parts.append(arr.tobytes())
+    return b"".join(parts)
+
+
+def decode_arrays(data: bytes) -> List[array]:
+    """Deserialise arrays written by `encode_arrays`.
+
+    Raises a ValueError if `data` is not a valid cache entry.
+    """
+    try:
+        magic, version, n_arrays = HEADER.unpack_from(data)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError("Not a parsed input cache entry")
+        offset = HEADER.size
+        arrays = []
+        for _ in range(n_arrays):
+            typecode, length = ARRAY_HEADER.unpack_from(data, offset)
+            offset += ARRAY_HEADER.size
+            arr = array(typecode.decode("ascii"))
+            end = offset + length * arr.itemsize
+            if end > len(data):
+                raise ValueError("Truncated parsed input cache entry")
+            arr.frombytes(data[offset:end])
+            arrays.append(arr)
+            offset = end
+    except struct.error as exc:
+        raise ValueError("Truncated parsed input cache entry") from exc
+    return arrays
+
+
+def to_ragged(rows: Sequence[Sequence[int]]) -> List[List[int]]:
+    """Flatten rows of varying length into `[offsets, values]`, where row `i`
+    is `values[offsets[i]:offsets[i + 1]]`.
+    """
+    offsets = [0]
+    values: List[int] = []
+    for row in rows:
+        values.extend(row)
+        offsets.append(len(values))
+    return [offsets, values]
+
+
+def from_ragged(offsets: Sequence[int], values: Sequence[int]) -> List[List[int]]:
+    """Inverse of `to_ragged`."""
+    return [list(values[start:stop]) for start, stop in zip(offsets, offsets[1:])]
+
+
+def cached_parse(
+    filepath: str,
+    parser: str,
+    parse: Callable[[InputData], Sequence[Sequence[int]]],
+    typecodes: str = "",
+) -> Sequence[Sequence[int]]:
+    """Return the parsed contents of the input at `filepath`, from the cache
+    if possible.
+
+    Args:
+        filepath (str): Path to the puzzle input
+        parser (str): Name identifying `parse`. Change it whenever the output
+        of `parse` changes.
+        parse (Callable): Parses the input into a sequence of integer
+        sequences
+        typecodes (str): `array` typecode to store each sequence with.
+        Sequences without a typecode are stored as signed 64-bit integers.
+
+    Returns:
+        The sequences returned by `parse`, or `array`s with the same contents
+        when read from the cache.
+    """
+    input_data = read_input(filepath)
+    if not cache_enabled():
+        return parse(input_data)
+
+    cache = ParsedInputCache()
+    key = cache.key(filepath, input_data.data, parser)
+    cached = cache.load(key)
+    if cached is not None:
+        return cached
+
+    parsed = parse(input_data)
+    try:
+        arrays = [
+            array(typecodes[idx] if idx < len(typecodes) else "q", values)
+            for idx, values in enumerate(parsed)
+        ]
+    except OverflowError:
+        # Values too large for a fixed-width array; don't cache this input
+        return parsed
+    try:
+        cache.store(key, arrays)
+    except OSError:
+        pass
+    return parsed
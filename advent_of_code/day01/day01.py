@@ -10,14 +10,23 @@ number in the left list after multiplying it by the number of times it appears
 in the right list).
 """
 
-from advent_of_code import util
+import importlib.util
+import os
+from collections import Counter
+from typing import List
+
+from advent_of_code import cache, util
+from advent_of_code.util import InputData
 
 INPUT_DAY1_PATH = "advent_of_code/day01/input_day01.txt"
+# Inputs smaller than this are faster to solve in pure Python than it is to
+# import NumPy
+NUMPY_MIN_INPUT_BYTES = 1024 * 1024
 
 
 def main() -> None:
     """Solve and print the answers."""
-    my_historian_list = HistorianList(INPUT_DAY1_PATH)
+    my_historian_list = load_historian_list(INPUT_DAY1_PATH)
     # Part one
     util.print_output_string(1, 1)
     print(my_historian_list.distance)
@@ -26,23 +35,42 @@ def main() -> None:
     print(my_historian_list.similarity)
 
 
+def part_one() -> int:
+    """Return the answer to part one."""
+    return load_historian_list(INPUT_DAY1_PATH).distance
+
+
+def part_two() -> int:
+    """Return the answer to part two."""
+    return load_historian_list(INPUT_DAY1_PATH).similarity
+
+
+def load_historian_list(filepath: str) -> "HistorianList":
+    """Return a HistorianList for the input at `filepath`.
+
+    Large inputs use the NumPy backend when NumPy is installed; otherwise the
+    pure-Python HistorianList is used.
+    """
+    if (
+        os.path.getsize(filepath) >= NUMPY_MIN_INPUT_BYTES
+        and importlib.util.find_spec("numpy") is not None
+    ):
+        # pylint: disable=import-outside-toplevel
+        from advent_of_code.day01.numpy_backend import NumpyHistorianList
+
+        return NumpyHistorianList(filepath)
+    return HistorianList(filepath)
+
+
 class HistorianList:
     """Class to keep track of items in two lists."""
 
     def __init__(self, filepath: str):
-        self.left_list = []
-        self.right_list = []
-        with open(
-            filepath,
-            encoding="utf-8",
-        ) as file:
-            for line in file:
-                line_as_list = line.strip("\n").split()
-                self.left_list.append(int(line_as_list[0]))
-                self.right_list.append(int(line_as_list[1]))
-        self.left_list.sort()
-        self.right_list.sort()
+        left_list, right_list = cache.cached_parse(filepath, "day01.sorted_columns", parse_input)
+        self.left_list: List[int] = list(left_list)
+        self.right_list: List[int] = list(right_list)
         self._distance = None
+        self._similarity = None
 
     @property
     def length(self) -> int:
@@ -61,16 +89,9 @@ class HistorianList:
         """Calculate the similarity score between the left list and the right
         list.
         """
-        # add up each number in the left list after multiplying it by the
-        # number of times it appears in the right list.
-        left_list_set = list(set(self.left_list))
-        set_length = len(left_list_set)
-        # Multiply each item in the left list by the number of times it appears
-        # in the right list
-        for i in range(set_length):
-            left_list_set[i] *= self.right_list.count(left_list_set[i])
-        # Sum the result
-        return sum(left_list_set)
+        if self._similarity is None:
+            self._calculate_similarity()
+        return self._similarity
 
     def _calculate_distance(self):
         """Calculate the distance between the left list and the right list."""
@@ -78,3 +99,22 @@ class HistorianList:
         for i in range(self.length):
             distance += abs(self.left_list[i] - self.right_list[i])
         self._distance = distance
+
+    def _calculate_similarity(self):
+        """Calculate the similarity score between the left list and the right
+        list.
+
+        Adds up each distinct number in the left list after multiplying it by
+        the number of times it appears in the right list, using a histogram of
+        the right list so each lookup is O(1).
+        """
+        right_list_counts = Counter(self.right_list)
+        self._similarity = sum(item * right_list_counts[item] for item in set(self.left_list))
+
+
+def parse_input(input_data: InputData) -> List[List[int]]:
+    """Parse the input into the sorted left and right lists."""
+    left_list, right_list = input_data.int_columns(2)
+    left_list.sort()
+    right_list.sort()
+    return [left_list, right_list]
@@ -0,0 +1,49 @@
+"""NumPy backend for Advent of Code 2024, day 1, for very large location lists.
+
+Requires NumPy, which is an optional dependency. Use
+`day01.load_historian_list` to select this backend automatically.
+"""
+
+from advent_of_code import util
+from advent_of_code.day01.day01 import HistorianList
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+
+class NumpyHistorianList(HistorianList):
+    """HistorianList where each list is a sorted `int64` NumPy array."""
+
+    # pylint: disable=super-init-not-called
+    def __init__(self, filepath: str):
+        if np is None:
+            raise ImportError("NumpyHistorianList requires NumPy to be installed")
+        # Parse both columns in a single bulk pass over the raw file contents
+        values = np.fromstring(util.read_input(filepath).data, dtype=np.int64, sep=" ")
+        if values.size % 2:
+            raise ValueError("Input does not have 2 integer columns")
+        self.left_list = values[0::2].copy()
+        self.right_list = values[1::2].copy()
+        self.left_list.sort()
+        self.right_list.sort()
+        self._distance = None
+        self._similarity = None
+
+    def _calculate_distance(self):
+        """Calculate the distance between the left list and the right list."""
+        self._distance = int(np.abs(self.left_list - self.right_list).sum())
+
+    def _calculate_similarity(self):
+        """Calculate the similarity score between the left list and the right
+        list.
+
+        The right list is sorted, so the number of times each distinct left
+        value appears in it is the width of its `searchsorted` range.
+        """
+        distinct_left = np.unique(self.left_list)
+        right_list_counts = np.searchsorted(
+            self.right_list, distinct_left, side="right"
+        ) - np.searchsorted(self.right_list, distinct_left, side="left")
+        self._similarity = int((distinct_left * right_list_counts).sum())
@@ -0,0 +1,181 @@
+"""Streaming solution for Advent of Code 2024, day 1, with bounded memory.
+
+Location lists larger than memory are sorted externally: each column is read
+in runs of at most `run_size` values, and each run is sorted and spilled to a
+temporary file. Runs are merged at most `MERGE_FAN_IN` at a time, over as many
+passes as needed, so the number of open files and read buffers does not grow
+with the input. The remaining runs are then merged, and the distance and
+similarity are computed in a single pass over the merged values.
+"""
+
+import heapq
+import itertools
+import os
+import tempfile
+from array import array
+from operator import itemgetter
+from typing import Iterator, List, Tuple
+
+DEFAULT_RUN_SIZE = 1_000_000
+# Most runs of each list merged at once
+MERGE_FAN_IN = 16
+LEFT = 0
+RIGHT = 1
+
+
+def distance_and_similarity_streaming(
+    filepath: str, run_size: int = DEFAULT_RUN_SIZE
+) -> Tuple[int, int]:
+    """Return the distance and similarity score between the Historian's two
+    lists, holding at most `run_size` values of each list in memory at once.
+
+    While the runs are written, up to `run_size` values of each list are held.
+    While they are merged, at most `2 * MERGE_FAN_IN` runs are read at once,
+    each a block of `run_size // (2 * MERGE_FAN_IN)` values at a time.
+    """
+    block_size = max(1, run_size // (2 * MERGE_FAN_IN))
+    with tempfile.TemporaryDirectory(prefix="advent_of_code_day01_") as directory:
+        left_runs, right_runs = write_sorted_runs(filepath, run_size, directory)
+        left_runs = merge_runs(left_runs, directory, block_size)
+        right_runs = merge_runs(right_runs, directory, block_size)
+        tagged_values = heapq.merge(
+            *(tag_values(iter_run(path, block_size), LEFT) for path in left_runs),
+            *(tag_values(iter_run(path, block_size), RIGHT) for path in right_runs),
+        )
+        return distance_and_similarity_from_merged(tagged_values)
+
+
+def write_sorted_runs(filepath: str, run_size: int, directory: str) -> Tuple[List[str], List[str]]:
+    """Split each column of the input at `filepath` into sorted runs of at most
+    `run_size` values, written to files in `directory`.
+
+    Returns the paths of the left list runs and of the right list runs.
+    """
+    left_runs: List[str] = []
+    right_runs: List[str] = []
+    left_list: List[int] = []
+    right_list: List[int] = []
+    with open(
+        filepath,
+        encoding="utf-8",
+    ) as file:
+        for line in file:
+            line_as_list = line.split()
+            if not line_as_list:
+                continue
+            left_list.append(int(line_as_list[0]))
+            right_list.append(int(line_as_list[1]))
+            if len(left_list) >= run_size:
+                spill_run(left_list, directory, left_runs)
+                spill_run(right_list, directory, right_runs)
+    if left_list:
+        spill_run(left_list, directory, left_runs)
+        spill_run(right_list, directory, right_runs)
+    return left_runs, right_runs
+
+
+def spill_run(values: List[int], directory: str, runs: List[str]) -> None:
+    """Sort `values`, write them to a new run file in `directory`, append its
+    path to `runs`, and empty `values`.
+    """
+    values.sort()
+    fd, path = tempfile.mkstemp(dir=directory, suffix=".run")
+    with os.fdopen(fd, "wb") as file:
+        array("q", values).tofile(file)
+    runs.append(path)
+    values.clear()
+
+
+def merge_runs(runs: List[str], directory: str, block_size: int) -> List[str]:
+    """Merge groups of at most `MERGE_FAN_IN` runs into new runs in
+    `directory`, deleting the merged runs, until at most `MERGE_FAN_IN` runs
+    are left. Return the paths of the remaining runs.
+    """
+    while len(runs) > MERGE_FAN_IN:
+        merged_runs = []
+        for start in range(0, len(runs), MERGE_FAN_IN):
+            stop = start + MERGE_FAN_IN
+            group = runs[start:stop]
+            if len(group) == 1:
+                merged_runs.append(group[0])
+                continue
+            merged = heapq.merge(*(iter_run(path, block_size) for path in group))
+            merged_runs.append(write_run(merged, directory, block_size))
+            for path in group:
+                os.unlink(path)
+        runs = merged_runs
+    return runs
+
+
+def write_run(values: Iterator[int], directory: str, block_size: int) -> str:
+    """Write ascending `values` to a new run file in `directory`, a block at a
+    time, and return its path.
+    """
+    fd, path = tempfile.mkstemp(dir=directory, suffix=".run")
+    with os.fdopen(fd, "wb") as file:
+        while True:
+            block = array("q", itertools.islice(values, block_size))
+            if not block:
+                break
+            block.tofile(file)
+    return path
+
+
+def iter_run(path: str, block_size: int) -> Iterator[int]:
+    """Yield the values in a run file, reading `block_size` values at a
+    time.
+    """
+    with open(path, "rb") as file:
+        while True:
+            block = array("q")
+            try:
+                block.fromfile(file, block_size)
+            except EOFError:
+                # Fewer than `block_size` values were left; `block` holds
+                # whatever was read
+                yield from block
+                return
+            yield from block
+
+
+def tag_values(values: Iterator[int], side: int) -> Iterator[Tuple[int, int]]:
+    """Pair each value with the list (LEFT or RIGHT) it came from."""
+    for value in values:
+        yield value, side
+
+
+def distance_and_similarity_from_merged(
+    tagged_values: Iterator[Tuple[int, int]]
+) -> Tuple[int, int]:
+    """Compute the distance and similarity score from the values of both lists,
+    merged into a single ascending stream of (value, side) pairs.
+
+    Pairing the i-th smallest left and right values, the distance is the area
+    between the two lists' counting functions: between consecutive distinct
+    values, every unmatched value contributes the width of the gap. So the
+    distance is the sum of |left count - right count| * gap, and no values
+    need to be buffered.
+    """
+    distance = 0
+    similarity = 0
+    # Number of left values seen so far, minus number of right values
+    balance = 0
+    previous_value = None
+    for value, group in itertools.groupby(tagged_values, key=itemgetter(0)):
+        if previous_value is not None:
+            distance += abs(balance) * (value - previous_value)
+        n_left = 0
+        n_right = 0
+        for _, side in group:
+            if side == LEFT:
+                n_left += 1
+            else:
+                n_right += 1
+        if n_left:
+            # Each distinct left value counts once, as in HistorianList
+            similarity += value * n_right
+        balance += n_left - n_right
+        previous_value = value
+    if balance:
+        raise ValueError("The left and right lists are different lengths")
+    return distance, similarity
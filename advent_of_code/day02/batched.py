@@ -0,0 +1,132 @@
+"""Batched, vectorised evaluation of the reports for Advent of Code 2024,
+day 2.
+
+All reports are loaded into one flat array of levels plus an array of offsets
+(a ragged, CSR-style layout), so the safety rules can be checked for every
+report at once. Only the reports that fail are given the dampened check,
+which is also vectorised by padding them into a 2D array.
+
+Requires NumPy, which is an optional dependency.
+"""
+
+from typing import Tuple
+
+from advent_of_code import util
+from advent_of_code.day02.day02 import is_levels_safe_dampened
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+# Failing reports longer than this are given the dampened check one at a time,
+# since the vectorised check takes time quadratic in the report length
+MAX_PADDED_LENGTH = 64
+
+
+def count_safe_reports_batched(filepath: str) -> Tuple[int, int]:
+    """Return the number of safe reports in the given file without and with
+    the Problem Dampener (that is, the answers to part one and part two).
+    """
+    levels, offsets = load_reports(filepath)
+    return evaluate_reports(levels, offsets)
+
+
+def load_reports(filepath: str) -> Tuple["np.ndarray", "np.ndarray"]:
+    """Load every report in the given file into a flat `int64` array of levels,
+    and an array of offsets such that report `i` is
+    `levels[offsets[i]:offsets[i + 1]]`.
+
+    Blank lines are skipped.
+    """
+    if np is None:
+        raise ImportError("Batched report evaluation requires NumPy to be installed")
+    data = util.read_input(filepath).data
+    raw = np.frombuffer(data, dtype=np.uint8)
+
+    levels = np.fromstring(data, dtype=np.int64, sep=" ")
+    # Work out which line each level is on from where each run of digits
+    # starts, relative to the newlines
+    is_digit = (raw >= ord("0")) & (raw <= ord("9"))
+    level_starts = np.flatnonzero(is_digit[1:] & ~is_digit[:-1]) + 1
+    if raw.size and is_digit[0]:
+        level_starts = np.concatenate(([0], level_starts))
+    if level_starts.size != levels.size:
+        raise ValueError("Reports must only contain non-negative integer levels")
+    line_of_level = np.searchsorted(np.flatnonzero(raw == ord("\n")), level_starts)
+
+    levels_per_line = np.bincount(line_of_level)
+    levels_per_report = levels_per_line[levels_per_line > 0]
+    offsets = np.zeros(levels_per_report.size + 1, dtype=np.int64)
+    np.cumsum(levels_per_report, out=offsets[1:])
+    return levels, offsets
+
+
+def evaluate_reports(levels: "np.ndarray", offsets: "np.ndarray") -> Tuple[int, int]:
+    """Return the number of safe reports without and with the Problem
+    Dampener, given reports in the layout returned by `load_reports`.
+    """
+    n_reports = offsets.size - 1
+    report_of_level = np.repeat(np.arange(n_reports), np.diff(offsets))
+
+    # Differences between adjacent levels, dropping those that span two
+    # reports
+    same_report = report_of_level[1:] == report_of_level[:-1]
+    differences = np.diff(levels)[same_report]
+    report_of_difference = report_of_level[:-1][same_report]
+
+    bad_increasing = np.bincount(
+        report_of_difference[~_is_step_safe(differences, 1)], minlength=n_reports
+    )
+    bad_decreasing = np.bincount(
+        report_of_difference[~_is_step_safe(differences, -1)], minlength=n_reports
+    )
+    safe = (bad_increasing == 0) | (bad_decreasing == 0)
+    safe_count = int(np.count_nonzero(safe))
+
+    unsafe_reports = np.flatnonzero(~safe)
+    lengths = offsets[unsafe_reports + 1] - offsets[unsafe_reports]
+    short_reports = unsafe_reports[lengths <= MAX_PADDED_LENGTH]
+    dampened_count = int(np.count_nonzero(_is_safe_dampened_padded(levels, offsets, short_reports)))
+    for report in unsafe_reports[lengths > MAX_PADDED_LENGTH]:
+        start, stop = offsets[report], offsets[report + 1]
+        if is_levels_safe_dampened(levels[start:stop].tolist()):
+            dampened_count += 1
+    return safe_count, safe_count + dampened_count
+
+
+def _is_step_safe(differences: "np.ndarray", direction: int) -> "np.ndarray":
+    """Vectorised `day02._is_step_safe` over differences between levels."""
+    steps = direction * differences
+    return (steps >= 1) & (steps <= 3)
+
+
+def _is_safe_dampened_padded(
+    levels: "np.ndarray", offsets: "np.ndarray", reports: "np.ndarray"
+) -> "np.ndarray":
+    """Return whether each of the given reports is safe after removing at most
+    one level.
+
+    The reports are padded into a 2D array with one report per row. Each
+    possible removal is then tested for every report at once, with padding
+    masked out.
+    """
+    lengths = offsets[reports + 1] - offsets[reports]
+    width = int(lengths.max()) if reports.size else 0
+    if width <= 2:
+        # Removing a level leaves at most one step, which is always safe
+        return np.ones(reports.size, dtype=bool)
+
+    columns = np.arange(width)
+    in_report = columns < lengths[:, None]
+    padded = levels[np.where(in_report, offsets[reports][:, None] + columns, 0)]
+    # After removing a level, step j is within the report if j < length - 2
+    step_in_report = np.arange(width - 2) < (lengths - 2)[:, None]
+
+    safe = np.zeros(reports.size, dtype=bool)
+    for removed in range(width):
+        differences = np.diff(np.delete(padded, removed, axis=1), axis=1)
+        increasing = (_is_step_safe(differences, 1) | ~step_in_report).all(axis=1)
+        decreasing = (_is_step_safe(differences, -1) | ~step_in_report).all(axis=1)
+        safe |= (removed < lengths) & (increasing | decreasing)
+    return safe
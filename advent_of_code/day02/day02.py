@@ -17,25 +17,106 @@ def main():
     print(count_safe_reports(INPUT_DAY2_PATH, True))
 
 
+def part_one() -> int:
+    """Return the answer to part one."""
+    return count_safe_reports(INPUT_DAY2_PATH)
+
+
+def part_two() -> int:
+    """Return the answer to part two."""
+    return count_safe_reports(INPUT_DAY2_PATH, True)
+
+
 def count_safe_reports(filepath: str, allow_bad_level=False) -> int:
     """Count the number of safe reports for a given file.
 
     Each row in the given file should correspond to a 'report', with each item
-    in the row corresponding to a 'level'.
+    in the row corresponding to a 'level'. Blank lines are skipped.
     """
+    is_safe = is_levels_safe_dampened if allow_bad_level else is_levels_safe
     safe_count = 0
-    with open(
-        filepath,
-        encoding="utf-8",
-    ) as file:
-        for line in file:
-            # Iterate through each report, formatting as we go
-            report = line.strip("\n").split()
-            if is_report_safe(report, allow_bad_level):
-                safe_count += 1
+    for line in util.read_input(filepath).lines():
+        # Iterate through each report, parsing each level once
+        levels = [int(level) for level in line.split()]
+        if not levels:
+            continue
+        if is_safe(levels):
+            safe_count += 1
     return safe_count
 
 
+def is_levels_safe(levels: List[int]) -> bool:
+    """Return True if a report, given as a list of integer levels, is safe.
+
+    Equivalent to `is_report_safe(report)`.
+    """
+    return _all_steps_safe(levels, 1) or _all_steps_safe(levels, -1)
+
+
+def is_levels_safe_dampened(levels: List[int]) -> bool:
+    """Return True if a report, given as a list of integer levels, is safe
+    after removing at most one level.
+
+    Equivalent to `is_report_safe(report, allow_bad_level=True)`, but runs in
+    linear time without copying the report.
+    """
+    return _is_safe_with_one_removal(levels, 1) or _is_safe_with_one_removal(levels, -1)
+
+
+def _is_step_safe(first: int, second: int, direction: int) -> bool:
+    """Return True if going from `first` to `second` moves in `direction`
+    (1 for increasing, -1 for decreasing) by at least one and at most three.
+    """
+    return 1 <= direction * (second - first) <= 3
+
+
+def _all_steps_safe(levels: List[int], direction: int) -> bool:
+    """Return True if every adjacent pair of levels is a safe step in
+    `direction`.
+    """
+    for i in range(1, len(levels)):
+        if not _is_step_safe(levels[i - 1], levels[i], direction):
+            return False
+    return True
+
+
+def _is_safe_with_one_removal(levels: List[int], direction: int) -> bool:
+    """Return True if every step is safe in `direction` after removing at most
+    one level.
+
+    `prefix_safe[i]` records whether levels[:i + 1] are all safe steps, and
+    `suffix_safe[i]` whether levels[i:] are. Removing level k then leaves a
+    safe report if the prefix before it and the suffix after it are safe, and
+    the step that bridges the gap is safe too.
+    """
+    n_levels = len(levels)
+    if n_levels <= 2:
+        return True
+
+    prefix_safe = [True] * n_levels
+    for i in range(1, n_levels):
+        prefix_safe[i] = prefix_safe[i - 1] and _is_step_safe(levels[i - 1], levels[i], direction)
+    if prefix_safe[-1]:
+        return True
+
+    suffix_safe = [True] * n_levels
+    for i in range(n_levels - 2, -1, -1):
+        suffix_safe[i] = suffix_safe[i + 1] and _is_step_safe(levels[i], levels[i + 1], direction)
+
+    # Remove the first or last level
+    if suffix_safe[1] or prefix_safe[-2]:
+        return True
+    # Remove a level in the middle
+    for k in range(1, n_levels - 1):
+        if (
+            prefix_safe[k - 1]
+            and suffix_safe[k + 1]
+            and _is_step_safe(levels[k - 1], levels[k + 1], direction)
+        ):
+            return True
+    return False
+
+
 def is_report_safe(report: List[str], allow_bad_level=False) -> bool:
     """Return True if a report is safe, False otherwise.
 
@@ -0,0 +1,83 @@
+"""Multiprocess solution for Advent of Code 2024, day 2, for very large report
+files.
+
+The file is split into byte ranges aligned on newlines, and each range is
+scored by a worker process that memory-maps the file, so no report data is
+sent between processes.
+"""
+
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
+
+from advent_of_code.day02.day02 import is_levels_safe, is_levels_safe_dampened
+
+
+def count_safe_reports_parallel(filepath: str, workers: Optional[int] = None) -> Tuple[int, int]:
+    """Return the number of safe reports in the given file without and with
+    the Problem Dampener (that is, the answers to part one and part two).
+
+    Args:
+        filepath (str): Path to the report file
+        workers (Optional[int]): Number of worker processes. Defaults to the
+        number of CPUs.
+    """
+    workers = workers or os.cpu_count() or 1
+    shards = shard_file(filepath, workers)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(count_safe_reports_in_range, filepath, start, end)
+            for start, end in shards
+        ]
+        counts = [future.result() for future in futures]
+    return sum(count[0] for count in counts), sum(count[1] for count in counts)
+
+
+def shard_file(filepath: str, n_shards: int) -> List[Tuple[int, int]]:
+    """Split the given file into at most `n_shards` (start, end) byte ranges of
+    roughly equal size, each starting at the beginning of a line.
+    """
+    size = os.path.getsize(filepath)
+    if size == 0:
+        return []
+    boundaries = [0]
+    with open(filepath, "rb") as file, mmap.mmap(
+        file.fileno(), 0, access=mmap.ACCESS_READ
+    ) as mapped:
+        for shard in range(1, n_shards):
+            target = max(size * shard // n_shards, boundaries[-1])
+            newline = mapped.find(b"\n", target)
+            if newline == -1 or newline + 1 >= size:
+                break
+            if newline + 1 > boundaries[-1]:
+                boundaries.append(newline + 1)
+    boundaries.append(size)
+    return list(zip(boundaries[:-1], boundaries[1:]))
+
+
+def count_safe_reports_in_range(filepath: str, start: int, end: int) -> Tuple[int, int]:
+    """Return the number of safe reports without and with the Problem Dampener,
+    among the lines in the byte range [start, end) of the given file.
+
+    Blank lines are skipped.
+    """
+    safe_count = 0
+    dampened_count = 0
+    with open(filepath, "rb") as file, mmap.mmap(
+        file.fileno(), 0, access=mmap.ACCESS_READ
+    ) as mapped:
+        position = start
+        while position < end:
+            newline = mapped.find(b"\n", position, end)
+            line_end = end if newline == -1 else newline
+            levels = [int(level) for level in mapped[position:line_end].split()]
+            position = line_end + 1
+            if not levels:
+                continue
+            if is_levels_safe(levels):
+                safe_count += 1
+                dampened_count += 1
+            elif is_levels_safe_dampened(levels):
+                dampened_count += 1
+    return safe_count, dampened_count
@@ -0,0 +1,61 @@
+"""Regex-free scanner for the multiplication instructions of Advent of Code
+2024, day 3.
+
+Scans a bytes-like buffer with `find(b"mul(")` and parses the operands inline,
+one byte at a time.
+"""
+
+from typing import Union
+
+MUL_PREFIX = b"mul("
+COMMA = ord(",")
+CLOSE_BRACKET = ord(")")
+ZERO = ord("0")
+NINE = ord("9")
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+
+def sum_mul_instructions(buffer: Buffer) -> int:
+    """Return the sum of the products of every valid `mul(x,y)` instruction in
+    `buffer`. Equivalent to `day03.find_and_multiply_all_mul_strings`.
+
+    Args:
+        buffer (Buffer): Corrupted memory. Anything with a `find` method
+        (bytes, bytearray, mmap) is scanned in place; a memoryview is copied
+        first, since it has no `find`.
+    """
+    if isinstance(buffer, memoryview):
+        buffer = buffer.tobytes()
+    size = len(buffer)
+    output = 0
+    position = buffer.find(MUL_PREFIX)
+    while position != -1:
+        idx = position + len(MUL_PREFIX)
+        first, idx = _parse_number(buffer, idx, size)
+        if first is not None and idx < size and buffer[idx] == COMMA:
+            second, idx = _parse_number(buffer, idx + 1, size)
+            if second is not None and idx < size and buffer[idx] == CLOSE_BRACKET:
+                output += first * second
+        # "mul(" cannot overlap itself, so resume after it
+        position = buffer.find(MUL_PREFIX, position + len(MUL_PREFIX))
+    return output
+
+
+def _parse_number(buffer: Buffer, idx: int, size: int):
+    """Parse the digits starting at `idx`.
+
+    Returns the number (or None if there are no digits) and the index of the
+    first byte after the digits.
+    """
+    number = 0
+    start = idx
+    while idx < size:
+        byte = buffer[idx]
+        if byte < ZERO or byte > NINE:
+            break
+        number = number * 10 + byte - ZERO
+        idx += 1
+    if idx == start:
+        return None, idx
+    return number, idx
@@ -10,28 +10,100 @@ to turn on/off the multiplication instructions.
 """
 
 import re
+from typing import Optional, Tuple
 
 from advent_of_code import util
+from advent_of_code.day03.byte_scanner import sum_mul_instructions
 
 INPUT_DAY3_PATH = "advent_of_code/day03/input_day03.txt"
 MUL_BRACKETS_REGEX = r"mul\(([0-9]+,[0-9]+)\)"
+MUL_BRACKETS_PATTERN = re.compile(MUL_BRACKETS_REGEX)
 DONT_INSTRUCTION = r"don't()"
 DO_INSTRUCTION = r"do()"
+# Matches any instruction. Groups 1 and 2 capture the operands of a `mul`;
+# group 3 matches `do()` and group 4 matches `don't()`.
+INSTRUCTION_PATTERN = re.compile(r"mul\(([0-9]+),([0-9]+)\)|(do\(\))|(don't\(\))")
+MUL_GROUP = 2
+DO_GROUP = 3
+# Engines for `find_and_multiply_all_mul_strings`
+REGEX_ENGINE = "regex"
+BYTES_ENGINE = "bytes"
 
 
 def main() -> None:
     """Calculate and print the solution to Advent of Code 2024, day 3."""
     input_str = util.file_contents_as_string(INPUT_DAY3_PATH)
-    # Use regex to find all matches in the input string
+    # Scan the input string once for both parts
+    part_one_sum, part_two_sum = scan_instructions(input_str)
     util.print_output_string(3, 1)
-    print(find_and_multiply_all_mul_strings(input_str))
+    print(part_one_sum)
     util.print_output_string(3, 2)
-    part_two = solve_part_two(input_str)
-    print(part_two)
+    print(part_two_sum)
 
 
-def find_and_multiply_all_mul_strings(input_str: str) -> int:
-    matches = re.findall(MUL_BRACKETS_REGEX, (input_str))
+def part_one() -> int:
+    """Return the answer to part one."""
+    return scan_instructions(util.file_contents_as_string(INPUT_DAY3_PATH))[0]
+
+
+def part_two() -> int:
+    """Return the answer to part two."""
+    return scan_instructions(util.file_contents_as_string(INPUT_DAY3_PATH))[1]
+
+
+def scan_instructions(input_str: str, enabled: bool = True) -> Tuple[int, int]:
+    """Scan the input string once, and return the sum of all multiplications
+    (part one) and the sum of the enabled multiplications (part two).
+
+    Multiplications are enabled at the start of the input, disabled by each
+    `don't()` and re-enabled by each `do()`.
+
+    Args:
+        input_str (str): Corrupted memory to scan
+        enabled (bool): Whether multiplications are enabled at the start of
+        `input_str`
+    """
+    part_one_sum, part_two_sum, _ = scan_instructions_with_state(input_str, enabled)
+    return part_one_sum, part_two_sum
+
+
+def scan_instructions_with_state(
+    input_str: str, enabled: bool = True, end: Optional[int] = None
+) -> Tuple[int, int, bool]:
+    """Same as `scan_instructions`, but only scans `input_str[:end]` (without
+    copying it), and also returns whether multiplications are enabled at the
+    end of the scanned text.
+    """
+    part_one_sum = 0
+    part_two_sum = 0
+    if end is None:
+        end = len(input_str)
+    for match in INSTRUCTION_PATTERN.finditer(input_str, 0, end):
+        instruction = match.lastindex
+        if instruction == MUL_GROUP:
+            product = int(match.group(1)) * int(match.group(2))
+            part_one_sum += product
+            if enabled:
+                part_two_sum += product
+        else:
+            enabled = instruction == DO_GROUP
+    return part_one_sum, part_two_sum, enabled
+
+
+def find_and_multiply_all_mul_strings(input_str: str, engine: str = REGEX_ENGINE) -> int:
+    """Return the sum of the products of every `mul(x,y)` instruction in the
+    input string.
+
+    Args:
+        input_str (str): Corrupted memory to scan
+        engine (str): REGEX_ENGINE to match instructions with a regular
+        expression, or BYTES_ENGINE to use the hand-written byte scanner
+    """
+    if engine == BYTES_ENGINE:
+        return sum_mul_instructions(input_str.encode("utf-8"))
+    if engine != REGEX_ENGINE:
+        raise ValueError(f"Unknown engine: {engine}")
+    matches = MUL_BRACKETS_PATTERN.findall(input_str)
     output = 0
     for match in matches:
         output += mul_string_to_number(match)
@@ -42,9 +114,12 @@ def solve_part_two(input_str: str) -> int:
     # Take input string and split wherever we find a `don't()` instruction
     split_input = input_str.split(DONT_INSTRUCTION)
     output = 0
-    # For each item in list, consider everything after a `do()`
-    for item in split_input:
-        instructions_to_keep = item.split(DO_INSTRUCTION)[1:]
+    # Multiplications are enabled until the first `don't()`. For each item
+    # after that, consider everything after a `do()`
+    for idx, item in enumerate(split_input):
+        instructions_to_keep = item.split(DO_INSTRUCTION)
+        if idx > 0:
+            instructions_to_keep = instructions_to_keep[1:]
         for instruction in instructions_to_keep:
             output += find_and_multiply_all_mul_strings(instruction)
     return output
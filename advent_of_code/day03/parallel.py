@@ -0,0 +1,115 @@
+"""Parallel solution for Advent of Code 2024, day 3.
+
+Part two depends on whether multiplications are enabled at the start of each
+part of the input, which depends on all the text before it. So each chunk of
+the input is scanned assuming both that it starts enabled and that it starts
+disabled, and records the state it leaves behind. A cheap sequential pass over
+the chunk results then picks the right sum for each chunk.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+from advent_of_code.day03.day03 import DO_GROUP, INSTRUCTION_PATTERN, MUL_GROUP
+
+
+@dataclass
+class ChunkTotals:
+    """Totals for one chunk of the input."""
+
+    # Sum of all multiplications
+    part_one_sum: int
+    # Sum of enabled multiplications, if enabled at the start of the chunk
+    sum_if_enabled: int
+    # Sum of enabled multiplications, if disabled at the start of the chunk
+    sum_if_disabled: int
+    # Whether multiplications are enabled at the end of the chunk, or None if
+    # the chunk has no `do()` or `don't()` (so the state passes through)
+    final_enabled: Optional[bool]
+
+
+def scan_instructions_parallel(input_str: str, workers: Optional[int] = None) -> Tuple[int, int]:
+    """Return the sum of all multiplications (part one) and the sum of the
+    enabled multiplications (part two), scanning chunks of the input in
+    `workers` processes.
+
+    Args:
+        input_str (str): Corrupted memory to scan
+        workers (Optional[int]): Number of worker processes. Defaults to the
+        number of CPUs.
+    """
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(scan_chunk, input_str[start:stop], end - start)
+            for start, end, stop in split_input(input_str, workers)
+        ]
+        return combine_chunk_totals([future.result() for future in futures])
+
+
+def split_input(input_str: str, n_chunks: int) -> List[Tuple[int, int, int]]:
+    """Split the input into at most `n_chunks` chunks of roughly equal size.
+
+    Returns (start, end, stop) for each chunk. The chunk owns the instructions
+    that start in [start, end), and `input_str[start:stop]` is long enough to
+    contain all of them. Every instruction ends with the first ")" after its
+    start, so `stop` is just after the first ")" at or after `end`.
+
+    Instructions can only begin with "m" or "d", neither of which appears
+    anywhere else in an instruction, so starting a chunk part way through an
+    instruction never produces a false match.
+    """
+    size = len(input_str)
+    chunks = []
+    start = 0
+    for chunk in range(1, n_chunks + 1):
+        end = size * chunk // n_chunks
+        if end <= start:
+            continue
+        close = input_str.find(")", end)
+        stop = size if close == -1 else close + 1
+        chunks.append((start, end, stop))
+        start = end
+    return chunks
+
+
+def scan_chunk(chunk: str, end: int) -> ChunkTotals:
+    """Scan the instructions that start before `end` in `chunk`, assuming both
+    possible states at the start of the chunk.
+    """
+    part_one_sum = 0
+    sum_if_enabled = 0
+    sum_if_disabled = 0
+    enabled = None
+    for match in INSTRUCTION_PATTERN.finditer(chunk):
+        if match.start() >= end:
+            break
+        instruction = match.lastindex
+        if instruction == MUL_GROUP:
+            product = int(match.group(1)) * int(match.group(2))
+            part_one_sum += product
+            if enabled is None:
+                # No `do()` or `don't()` yet, so this depends on the state at
+                # the start of the chunk
+                sum_if_enabled += product
+            elif enabled:
+                sum_if_enabled += product
+                sum_if_disabled += product
+        else:
+            enabled = instruction == DO_GROUP
+    return ChunkTotals(part_one_sum, sum_if_enabled, sum_if_disabled, enabled)
+
+
+def combine_chunk_totals(chunk_totals: List[ChunkTotals]) -> Tuple[int, int]:
+    """Combine the totals of consecutive chunks, starting enabled."""
+    part_one_sum = 0
+    part_two_sum = 0
+    enabled = True
+    for totals in chunk_totals:
+        part_one_sum += totals.part_one_sum
+        part_two_sum += totals.sum_if_enabled if enabled else totals.sum_if_disabled
+        if totals.final_enabled is not None:
+            enabled = totals.final_enabled
+    return part_one_sum, part_two_sum
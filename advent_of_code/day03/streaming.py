@@ -0,0 +1,60 @@
+"""Streaming solution for Advent of Code 2024, day 3, for corrupted memory too
+large to load at once (or read from stdin).
+
+The input is read in fixed-size chunks. Any text at the end of a chunk that
+could be the start of an instruction is carried over to the next chunk, so an
+instruction split across a chunk boundary is matched exactly once.
+"""
+
+import re
+from typing import TextIO, Tuple
+
+from advent_of_code.day03.day03 import scan_instructions_with_state
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+# Matches an incomplete instruction at the end of a chunk: any proper prefix
+# of `mul(a,b)`, `do()` or `don't()`
+PARTIAL_INSTRUCTION_PATTERN = re.compile(
+    r"(?:m(?:u(?:l(?:\((?:[0-9]+(?:,[0-9]*)?)?)?)?)?|d(?:o(?:n(?:'(?:t\(?)?)?|\()?)?)\Z"
+)
+
+
+def scan_instructions_stream(
+    stream: TextIO, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Tuple[int, int]:
+    """Read corrupted memory from `stream` a chunk at a time, and return the
+    sum of all multiplications (part one) and the sum of the enabled
+    multiplications (part two).
+
+    Memory use is bounded by `chunk_size` plus the length of the longest
+    instruction, regardless of the size of the input.
+    """
+    part_one_sum = 0
+    part_two_sum = 0
+    enabled = True
+    carry = ""
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        buffer = carry + chunk
+        # Hold back a possibly incomplete instruction at the end of the buffer
+        partial = PARTIAL_INSTRUCTION_PATTERN.search(buffer)
+        end = partial.start() if partial else len(buffer)
+        chunk_part_one, chunk_part_two, enabled = scan_instructions_with_state(buffer, enabled, end)
+        part_one_sum += chunk_part_one
+        part_two_sum += chunk_part_two
+        carry = buffer[end:]
+    # Any remaining carry is an incomplete instruction, so is ignored
+    return part_one_sum, part_two_sum
+
+
+def scan_instructions_file(filepath: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Tuple[int, int]:
+    """Same as `scan_instructions_stream`, reading from the file at
+    `filepath`.
+    """
+    with open(
+        filepath,
+        encoding="utf-8",
+    ) as file:
+        return scan_instructions_stream(file, chunk_size)
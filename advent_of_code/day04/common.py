@@ -2,6 +2,7 @@
 Common functionality for Advent of Code 2024, day 4, part 1 and 2.
 """
 
+from advent_of_code import util
 from advent_of_code.day04.classes import SearchPath
 
 
@@ -10,16 +11,9 @@ def wordsearch_file_to_array(filepath: str):
 
     Each item in the array is an array representing a row in the wordsearch.
     """
-    wordsearch = []
-    with open(
-        filepath,
-        encoding="utf-8",
-    ) as file:
-        # Interpret each line as an array
-        for line in file:
-            line = line.strip("\n")
-            wordsearch.append(list(line))
-    return wordsearch
+    grid = util.read_input(filepath).grid()
+    # Interpret each row as an array
+    return [list(str(row, "utf-8")) for row in grid.rows()]
 
 
 def get_correct_next_letter(current_letter: str, target_word: str):
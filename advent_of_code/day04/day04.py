@@ -3,19 +3,29 @@ Advent of Code 2024, day four.
 """
 
 from advent_of_code import util
-from advent_of_code.day04.common import wordsearch_file_to_array
-from advent_of_code.day04.part1 import count_xmas_in_wordsearch
-from advent_of_code.day04.part2 import count_x_shaped_mas_in_wordsearch
+from advent_of_code.day04 import flat
+from advent_of_code.day04.part1 import TARGET_WORD
 
 INPUT_FILEPATH = "advent_of_code/day04/input_day04.txt"
 
 
 def main() -> None:
     """Calculate and print the solution to Advent of Code 2024, day 4."""
-    wordsearch_arr = wordsearch_file_to_array(INPUT_FILEPATH)
+    # Neither part modifies the grid, so both can share it
+    grid = util.read_input(INPUT_FILEPATH).grid()
 
     util.print_output_string(4, 1)
-    print(count_xmas_in_wordsearch(wordsearch_arr))
+    print(flat.count_word_in_grid(grid, TARGET_WORD))
 
     util.print_output_string(4, 2)
-    print(count_x_shaped_mas_in_wordsearch(wordsearch_arr))
+    print(flat.count_x_shaped_mas_in_grid(grid))
+
+
+def part_one() -> int:
+    """Return the answer to part one."""
+    return flat.count_word_in_grid(util.read_input(INPUT_FILEPATH).grid(), TARGET_WORD)
+
+
+def part_two() -> int:
+    """Return the answer to part two."""
+    return flat.count_x_shaped_mas_in_grid(util.read_input(INPUT_FILEPATH).grid())
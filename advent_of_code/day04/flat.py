@@ -0,0 +1,127 @@
+"""Flat word search engine for Advent of Code 2024, day 4.
+
+Searches a `util.ByteGrid` (the word search as one flat buffer, addressed with
+`row * stride + col`) without recursion or per-step object creation. The row
+and column bounds of each direction are worked out once, so the letters of the
+target word can be compared with plain index arithmetic.
+"""
+
+from typing import List, Optional, Tuple
+
+from advent_of_code.util import ByteGrid
+
+X_MAS_CENTRE = b"A"
+X_MAS_FIRST = ord("M")
+X_MAS_LAST = ord("S")
+# (row increment, column increment) of every search direction, in the same
+# order as classes.Direction
+DIRECTION_OFFSETS = (
+    (0, 1),
+    (0, -1),
+    (-1, 0),
+    (1, 0),
+    (-1, 1),
+    (1, 1),
+    (-1, -1),
+    (1, -1),
+)
+
+
+def count_word_in_grid(
+    grid: ByteGrid, target_word: str, row_start: int = 0, row_stop: Optional[int] = None
+) -> int:
+    """Return how many times `target_word` appears in the word search, in any
+    of the eight directions. Equivalent to `part1.count_xmas_in_wordsearch`,
+    but the target word may contain repeated letters.
+
+    Only occurrences whose first letter is in rows [row_start, row_stop) are
+    counted, though the rest of the word may extend outside those rows.
+    """
+    if not target_word:
+        raise ValueError("Target word must not be empty")
+    if row_stop is None:
+        row_stop = grid.n_rows
+    target = target_word.encode("utf-8")
+    first_letter = target[:1]
+    remaining_letters = target[1:]
+    directions = _direction_bounds(grid, len(target) - 1)
+
+    data = grid.data
+    stride = grid.stride
+    n_cols = grid.n_cols
+    end = min(row_stop, grid.n_rows) * stride
+    count = 0
+    position = data.find(first_letter, row_start * stride, end)
+    while position != -1:
+        row, col = divmod(position, stride)
+        if col < n_cols:
+            for step, row_min, row_max, col_min, col_max in directions:
+                if not (row_min <= row < row_max and col_min <= col < col_max):
+                    continue
+                idx = position
+                for letter in remaining_letters:
+                    idx += step
+                    if data[idx] != letter:
+                        break
+                else:
+                    count += 1
+        position = data.find(first_letter, position + 1, end)
+    return count
+
+
+def count_x_shaped_mas_in_grid(
+    grid: ByteGrid, row_start: int = 0, row_stop: Optional[int] = None
+) -> int:
+    """Count how many times the X-shaped "MAS" pattern appears in the word
+    search, by checking the diagonal corners around every "A". Equivalent to
+    `part2.count_x_shaped_mas_centred`.
+
+    Only patterns centred in rows [row_start, row_stop) are counted.
+    """
+    if row_stop is None:
+        row_stop = grid.n_rows
+    data = grid.data
+    stride = grid.stride
+    # The centre cannot be on the edge of the word search
+    row_start = max(1, row_start)
+    end = min(row_stop, grid.n_rows - 1) * stride
+    count = 0
+    if row_start * stride >= end:
+        return count
+    position = data.find(X_MAS_CENTRE, row_start * stride, end)
+    while position != -1:
+        col = position % stride
+        if 0 < col < grid.n_cols - 1:
+            top_left = data[position - stride - 1]
+            bottom_right = data[position + stride + 1]
+            top_right = data[position - stride + 1]
+            bottom_left = data[position + stride - 1]
+            if (
+                (top_left == X_MAS_FIRST and bottom_right == X_MAS_LAST)
+                or (top_left == X_MAS_LAST and bottom_right == X_MAS_FIRST)
+            ) and (
+                (top_right == X_MAS_FIRST and bottom_left == X_MAS_LAST)
+                or (top_right == X_MAS_LAST and bottom_left == X_MAS_FIRST)
+            ):
+                count += 1
+        position = data.find(X_MAS_CENTRE, position + 1, end)
+    return count
+
+
+def _direction_bounds(grid: ByteGrid, length: int) -> List[Tuple[int, int, int, int, int]]:
+    """For each direction, return the offset between consecutive letters in
+    the flat buffer, and the range of rows and columns a word of `length + 1`
+    letters can start from without leaving the grid.
+    """
+    bounds = []
+    for row_increment, col_increment in DIRECTION_OFFSETS:
+        bounds.append(
+            (
+                row_increment * grid.stride + col_increment,
+                max(0, -row_increment * length),
+                grid.n_rows - max(0, row_increment * length),
+                max(0, -col_increment * length),
+                grid.n_cols - max(0, col_increment * length),
+            )
+        )
+    return bounds
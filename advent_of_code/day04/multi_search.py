@@ -0,0 +1,125 @@
+"""Search a word search for many words at once, for Advent of Code 2024,
+day 4.
+
+Every row, column and diagonal of the word search is extracted as a line once.
+An Aho-Corasick automaton for all of the target words is then run over each
+line, forwards and backwards, which covers all eight search directions.
+Unlike `common.is_target_in_search_path`, words may contain repeated letters.
+"""
+
+from collections import deque
+from typing import Dict, Iterable, List, Sequence
+
+
+class AhoCorasick:
+    """Aho-Corasick automaton that counts occurrences of a set of words."""
+
+    def __init__(self, words: Iterable[str]):
+        # Unique words, in the order first given
+        self.words: List[str] = list(dict.fromkeys(words))
+        if any(not word for word in self.words):
+            raise ValueError("Words must not be empty")
+        # Trie transitions, failure links, and the node each word ends at
+        self._transitions: List[Dict[str, int]] = [{}]
+        self._failure: List[int] = [0]
+        self._word_nodes: List[int] = []
+        # Nodes in breadth-first order, used to accumulate counts
+        self._bfs_order: List[int] = []
+        self._build()
+        self._visits: List[int] = [0] * len(self._transitions)
+
+    def _build(self) -> None:
+        """Build the trie of words, then the failure links."""
+        for word in self.words:
+            node = 0
+            for letter in word:
+                next_node = self._transitions[node].get(letter)
+                if next_node is None:
+                    next_node = len(self._transitions)
+                    self._transitions[node][letter] = next_node
+                    self._transitions.append({})
+                    self._failure.append(0)
+                node = next_node
+            self._word_nodes.append(node)
+
+        # The failure link of a node points to the node for its longest proper
+        # suffix that is also in the trie
+        queue = deque(self._transitions[0].values())
+        while queue:
+            node = queue.popleft()
+            self._bfs_order.append(node)
+            for letter, child in self._transitions[node].items():
+                fallback = self._failure[node]
+                while fallback and letter not in self._transitions[fallback]:
+                    fallback = self._failure[fallback]
+                self._failure[child] = self._transitions[fallback].get(letter, 0)
+                queue.append(child)
+
+    def feed(self, text: str) -> None:
+        """Scan `text`, recording which node the automaton is in after each
+        letter.
+        """
+        transitions = self._transitions
+        failure = self._failure
+        visits = self._visits
+        node = 0
+        for letter in text:
+            while node and letter not in transitions[node]:
+                node = failure[node]
+            node = transitions[node].get(letter, 0)
+            visits[node] += 1
+
+    def counts(self) -> Dict[str, int]:
+        """Return how many times each word occurred in all the text fed so far.
+
+        A word ends at a position whenever its node is the current node, or is
+        reachable from it by failure links. So the visits to each node are
+        pushed down the failure links, deepest nodes first.
+        """
+        totals = list(self._visits)
+        for node in reversed(self._bfs_order):
+            totals[self._failure[node]] += totals[node]
+        return {word: totals[node] for word, node in zip(self.words, self._word_nodes)}
+
+
+def wordsearch_lines(wordsearch_arr: Sequence[Sequence[str]]) -> List[str]:
+    """Return every row, column, diagonal and anti-diagonal of a rectangular
+    word search as a string, each read in one direction only.
+
+    Args:
+        wordsearch_arr (Sequence): Sequence where each item is a sequence (or
+        string) representing a row in the wordsearch
+    """
+    rows = ["".join(row) for row in wordsearch_arr]
+    n_rows = len(rows)
+    n_cols = len(rows[0]) if rows else 0
+    lines = list(rows)
+    lines.extend("".join(row[col] for row in rows) for col in range(n_cols))
+    # Diagonals run from top-left to bottom-right, anti-diagonals from
+    # top-right to bottom-left. Each starts on the top row or an edge column.
+    for offset in range(-(n_rows - 1), n_cols):
+        row_start = max(0, -offset)
+        row_stop = min(n_rows, n_cols - offset)
+        lines.append("".join(rows[row][row + offset] for row in range(row_start, row_stop)))
+    for total in range(n_rows + n_cols - 1):
+        row_start = max(0, total - (n_cols - 1))
+        row_stop = min(n_rows, total + 1)
+        lines.append("".join(rows[row][total - row] for row in range(row_start, row_stop)))
+    return lines
+
+
+def count_words_in_wordsearch(
+    wordsearch_arr: Sequence[Sequence[str]], words: Iterable[str]
+) -> Dict[str, int]:
+    """Return how many times each word appears in the word search, in any of
+    the eight directions.
+
+    For "XMAS", the count is the same as `part1.count_xmas_in_wordsearch`.
+    Like that function, a word that reads the same in two directions (such as
+    a palindrome) is counted once per direction.
+    """
+    automaton = AhoCorasick(words)
+    for line in wordsearch_lines(wordsearch_arr):
+        automaton.feed(line)
+        automaton.feed(line[::-1])
+    return automaton.counts()
@@ -0,0 +1,107 @@
+"""Parallel word search for Advent of Code 2024, day 4, for very large grids.
+
+The grid is split into horizontal bands, each searched by a worker process.
+A band owns the matches that start in its rows (or, for the X-shaped "MAS",
+are centred in them), and also reads a halo of rows either side of it, so
+matches that cross band boundaries are counted exactly once. The grid is
+placed in shared memory, so it is not pickled to every worker.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import List, Optional, Tuple
+
+from advent_of_code.day04 import flat
+from advent_of_code.day04.part1 import TARGET_WORD
+from advent_of_code.util import ByteGrid
+
+
+def count_in_bands(
+    grid: ByteGrid, target_word: str = TARGET_WORD, workers: Optional[int] = None
+) -> Tuple[int, int]:
+    """Return how many times `target_word` appears in the word search (part
+    one), and how many times the X-shaped "MAS" pattern appears (part two),
+    searching bands of rows in `workers` processes.
+
+    Args:
+        grid (ByteGrid): The word search
+        target_word (str): Word to search for in part one
+        workers (Optional[int]): Number of worker processes. Defaults to the
+        number of CPUs.
+    """
+    workers = workers or os.cpu_count() or 1
+    size = len(grid.data)
+    shm = shared_memory.SharedMemory(create=True, size=max(1, size))
+    try:
+        shm.buf[:size] = grid.data
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(
+                    count_band,
+                    shm.name,
+                    size,
+                    (grid.n_rows, grid.n_cols, grid.stride),
+                    (row_start, row_stop),
+                    target_word,
+                )
+                for row_start, row_stop in split_rows(grid.n_rows, workers)
+            ]
+            counts = [future.result() for future in futures]
+    finally:
+        shm.close()
+        shm.unlink()
+    return sum(count[0] for count in counts), sum(count[1] for count in counts)
+
+
+def split_rows(n_rows: int, n_bands: int) -> List[Tuple[int, int]]:
+    """Split `n_rows` rows into at most `n_bands` bands of roughly equal size,
+    returned as (row_start, row_stop) pairs.
+    """
+    boundaries = sorted({n_rows * band // n_bands for band in range(n_bands + 1)})
+    return list(zip(boundaries[:-1], boundaries[1:]))
+
+
+def count_band(
+    shm_name: str,
+    size: int,
+    shape: Tuple[int, int, int],
+    band: Tuple[int, int],
+    target_word: str,
+) -> Tuple[int, int]:
+    """Count the matches owned by rows [row_start, row_stop) of the grid in
+    shared memory.
+
+    Args:
+        shm_name (str): Name of the shared memory block holding the grid
+        size (int): Size of the grid's buffer, in bytes
+        shape (Tuple[int, int, int]): The grid's rows, columns and stride
+        band (Tuple[int, int]): The rows this band owns
+        target_word (str): Word to search for in part one
+    """
+    n_rows, n_cols, stride = shape
+    row_start, row_stop = band
+    # A word starting in the band can extend this many rows beyond it, and an
+    # X-shaped "MAS" one row
+    halo = max(1, len(target_word) - 1)
+    halo_start = max(0, row_start - halo)
+    halo_stop = min(n_rows, row_stop + halo)
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        view_start = halo_start * stride
+        view_stop = min(size, halo_stop * stride)
+        view = shm.buf[view_start:view_stop]
+        # Only this band and its halo are copied into the worker
+        data = bytes(view)
+        view.release()
+    finally:
+        shm.close()
+
+    band_grid = ByteGrid(data, halo_stop - halo_start, n_cols, stride)
+    owned_start = row_start - halo_start
+    owned_stop = row_stop - halo_start
+    return (
+        flat.count_word_in_grid(band_grid, target_word, owned_start, owned_stop),
+        flat.count_x_shaped_mas_in_grid(band_grid, owned_start, owned_stop),
+    )
@@ -3,7 +3,7 @@ Functions for Advent of Code day 4, part 2.
 """
 
 from dataclasses import dataclass
-from typing import List
+from typing import List, Optional
 
 from advent_of_code.day04.classes import Direction, SearchPath
 from advent_of_code.day04.common import is_target_in_search_path
@@ -50,6 +50,53 @@ def count_x_shaped_mas_in_wordsearch(wordsearch_arr: List) -> int:
     return times_target_appears
 
 
+def count_x_shaped_mas_centred(
+    wordsearch_arr: List, row_start: int = 0, row_stop: Optional[int] = None
+) -> int:
+    """Count how many times the X-shaped "MAS" pattern appears in a word
+    search, by checking the diagonal corners around every "A".
+
+    Unlike `count_x_shaped_mas_in_wordsearch`, this does not modify
+    `wordsearch_arr`: each X is only found once, from its centre. So the same
+    word search can safely be shared, or searched concurrently.
+
+    Args:
+        wordsearch_arr (List): List where each item is a list representing
+        a row in the wordsearch.
+        row_start (int): Only count patterns centred on this row or later
+        row_stop (Optional[int]): Only count patterns centred before this row
+    """
+    first_letter = TARGET_WORD[0]
+    centre_letter = TARGET_WORD[1]
+    last_letter = TARGET_WORD[-1]
+    n_rows = len(wordsearch_arr)
+    if row_stop is None:
+        row_stop = n_rows
+    times_target_appears = 0
+    # The centre cannot be on the edge of the word search
+    for curr_row in range(max(1, row_start), min(n_rows - 1, row_stop)):
+        above = wordsearch_arr[curr_row - 1]
+        row = wordsearch_arr[curr_row]
+        below = wordsearch_arr[curr_row + 1]
+        for curr_col in range(1, len(row) - 1):
+            if row[curr_col] != centre_letter:
+                continue
+            top_left = above[curr_col - 1]
+            bottom_right = below[curr_col + 1]
+            if not (
+                (top_left == first_letter and bottom_right == last_letter)
+                or (top_left == last_letter and bottom_right == first_letter)
+            ):
+                continue
+            top_right = above[curr_col + 1]
+            bottom_left = below[curr_col - 1]
+            if (top_right == first_letter and bottom_left == last_letter) or (
+                top_right == last_letter and bottom_left == first_letter
+            ):
+                times_target_appears += 1
+    return times_target_appears
+
+
 def is_position_part_of_x_shaped_mas(
     wordsearch_arr: List, curr_row: int, curr_col: int
 ) -> BoolAndSearchPath:
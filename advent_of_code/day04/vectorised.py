@@ -0,0 +1,86 @@
+"""Vectorised word search for Advent of Code 2024, day 4.
+
+The word search is loaded as a 2D `uint8` NumPy array. Words are counted in
+each direction by AND-ing shifted slices of a mask per letter, so every
+starting cell is tested at once.
+
+Requires NumPy, which is an optional dependency.
+"""
+
+from advent_of_code.day04.flat import DIRECTION_OFFSETS
+from advent_of_code.util import ByteGrid
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+X_MAS_CENTRE = ord("A")
+X_MAS_ENDS = (ord("M"), ord("S"))
+
+
+def grid_to_array(grid: ByteGrid) -> "np.ndarray":
+    """Return a `(n_rows, n_cols)` `uint8` view of the word search."""
+    if np is None:
+        raise ImportError("The vectorised word search requires NumPy to be installed")
+    data = np.frombuffer(grid.data, dtype=np.uint8)
+    size = grid.n_rows * grid.stride
+    if data.size < size:
+        # The last row has no line terminator
+        data = np.concatenate((data, np.zeros(size - data.size, dtype=np.uint8)))
+    return data[:size].reshape(grid.n_rows, grid.stride)[:, : grid.n_cols]
+
+
+def count_word_vectorised(letters: "np.ndarray", target_word: str) -> int:
+    """Return how many times `target_word` appears in the word search, in any
+    of the eight directions. Equivalent to `flat.count_word_in_grid`.
+
+    Args:
+        letters (np.ndarray): The word search, as returned by `grid_to_array`
+        target_word (str): Word to search for
+    """
+    target = target_word.encode("utf-8")
+    length = len(target) - 1
+    n_rows, n_cols = letters.shape
+    letter_masks = {letter: letters == letter for letter in set(target)}
+    count = 0
+    for row_increment, col_increment in DIRECTION_OFFSETS:
+        # Range of cells the word can start from without leaving the grid
+        row_min = max(0, -row_increment * length)
+        row_max = n_rows - max(0, row_increment * length)
+        col_min = max(0, -col_increment * length)
+        col_max = n_cols - max(0, col_increment * length)
+        if row_max <= row_min or col_max <= col_min:
+            continue
+        found = np.ones((row_max - row_min, col_max - col_min), dtype=bool)
+        for idx, letter in enumerate(target):
+            row_shift = idx * row_increment
+            col_shift = idx * col_increment
+            rows = slice(row_min + row_shift, row_max + row_shift)
+            cols = slice(col_min + col_shift, col_max + col_shift)
+            found &= letter_masks[letter][rows, cols]
+        count += int(np.count_nonzero(found))
+    return count
+
+
+def count_x_shaped_mas_vectorised(letters: "np.ndarray") -> int:
+    """Return how many times the X-shaped "MAS" pattern appears in the word
+    search. Equivalent to `part2.count_x_shaped_mas_in_wordsearch`.
+
+    Tests the four diagonal corners around every "A" in one array expression.
+    """
+    if letters.shape[0] < 3 or letters.shape[1] < 3:
+        return 0
+    first, last = X_MAS_ENDS
+    top_left = letters[:-2, :-2]
+    top_right = letters[:-2, 2:]
+    bottom_left = letters[2:, :-2]
+    bottom_right = letters[2:, 2:]
+    diagonal = ((top_left == first) & (bottom_right == last)) | (
+        (top_left == last) & (bottom_right == first)
+    )
+    anti_diagonal = ((top_right == first) & (bottom_left == last)) | (
+        (top_right == last) & (bottom_left == first)
+    )
+    centre = letters[1:-1, 1:-1] == X_MAS_CENTRE
+    return int(np.count_nonzero(centre & diagonal & anti_diagonal))
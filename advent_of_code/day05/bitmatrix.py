@@ -0,0 +1,223 @@
+"""Dense precedence matrix backend for Advent of Code 2024, day 5.
+
+The ordering rules are stored as a square boolean matrix, where cell `[a, b]`
+is set if page `a` must be printed before page `b`. Pages are numbered by
+their position among the distinct pages in the rules, so the matrix size does
+not depend on how large the page numbers are. Every update is stored as one
+row of a padded 2D array, so checking the order of every update is a handful
+of vectorised gathers from the matrix rather than a loop per update.
+
+Uses NumPy, which is an optional dependency, when it is installed. Otherwise
+the matrix is a `bytearray` and updates are checked one at a time. Updates are
+assumed not to contain the same page twice.
+"""
+
+from typing import List, Sequence, Tuple
+
+from advent_of_code import cache
+from advent_of_code.day05.day05 import parse_input
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+# Most distinct pages the rules may mention. The matrix takes up to 16 MiB.
+MAX_PAGES = 4096
+# Memory for the pairwise rule lookups of each batch of incorrectly-ordered
+# updates. A batch of n updates of (padded) width w uses n * w * w bytes.
+REORDER_BUDGET_BYTES = 64 * 1024 * 1024
+
+
+class PrecedenceMatrix:
+    """Ordering rules as a dense matrix, built from the first and second page
+    of each rule.
+
+    Each page in the rules is given an index, its position in `self.pages`.
+    The matrix has one more row and column than there are pages: the extra
+    index, `self.pad_index`, has no rules. It is the index of every page that
+    is not in the rules, and can be used to pad updates to the same length.
+    """
+
+    def __init__(self, first_pages: Sequence[int], second_pages: Sequence[int]):
+        if np is not None:
+            first_pages = np.asarray(first_pages, dtype=np.int64)
+            second_pages = np.asarray(second_pages, dtype=np.int64)
+            self.pages = np.union1d(first_pages, second_pages)
+        else:
+            self.pages = sorted(set(first_pages) | set(second_pages))
+        if len(self.pages) > MAX_PAGES:
+            raise ValueError(
+                f"Rules must mention at most {MAX_PAGES} pages, found {len(self.pages)}"
+            )
+        self.pad_index = len(self.pages)
+        self.size = len(self.pages) + 1
+
+        if np is not None:
+            self.cells = np.zeros((self.size, self.size), dtype=bool)
+            self.cells[self.indices(first_pages), self.indices(second_pages)] = True
+        else:
+            self._page_indices = {page: idx for idx, page in enumerate(self.pages)}
+            self.cells = bytearray(self.size * self.size)
+            for first_page, second_page in zip(first_pages, second_pages):
+                self.cells[self.index(first_page) * self.size + self.index(second_page)] = 1
+
+    def index(self, page: int) -> int:
+        """Return the index of a page in the matrix."""
+        if np is not None:
+            return int(self.indices([page])[0])
+        return self._page_indices.get(page, self.pad_index)
+
+    def indices(self, pages: Sequence[int]) -> "np.ndarray":
+        """Return the index of each of the given pages in the matrix, as an
+        array. Requires NumPy.
+        """
+        pages = np.asarray(pages, dtype=np.int64)
+        indices = np.searchsorted(self.pages, pages)
+        found = indices < len(self.pages)
+        found[found] = self.pages[indices[found]] == pages[found]
+        indices[~found] = self.pad_index
+        return indices
+
+    def must_precede(self, a: int, b: int) -> bool:
+        """Return True if there is a rule that page `a` must be printed before
+        page `b`, False otherwise.
+        """
+        a_index = self.index(a)
+        b_index = self.index(b)
+        if np is not None:
+            return bool(self.cells[a_index, b_index])
+        return bool(self.cells[a_index * self.size + b_index])
+
+    def is_correctly_ordered(self, page_list: List[int]) -> bool:
+        """Return True if no page in the update must be printed before a page
+        that comes earlier in it, False otherwise.
+        """
+        for idx, later_page in enumerate(page_list):
+            for earlier_page in page_list[:idx]:
+                if self.must_precede(later_page, earlier_page):
+                    return False
+        return True
+
+    def middle_of_reordered(self, page_list: List[int]) -> int:
+        """Return the page in the middle of the update once it is put in
+        order. There must be a rule between every pair of its pages.
+        """
+        target = (len(page_list) - 1) // 2
+        for page in page_list:
+            n_before = sum(self.must_precede(other, page) for other in page_list)
+            if n_before == target:
+                return page
+        raise ValueError(f"Rules do not define a total order of {page_list}")
+
+
+def pad_updates(
+    offsets: Sequence[int], values: Sequence[int], pad_value: int
+) -> Tuple["np.ndarray", "np.ndarray"]:
+    """Return the updates as a `(n_updates, longest_update)` array, padded with
+    `pad_value`, and the length of each update.
+
+    Args:
+        offsets (Sequence[int]): Update `i` is `values[offsets[i]:offsets[i + 1]]`
+        values (Sequence[int]): Values (e.g. matrix indices of the pages) of
+        every update, one after another
+        pad_value (int): Value to pad the shorter updates with
+    """
+    if np is None:
+        raise ImportError("Padding the updates into an array requires NumPy to be installed")
+    offsets = np.asarray(offsets, dtype=np.intp)
+    lengths = np.diff(offsets)
+    width = int(lengths.max(initial=0))
+    updates = np.full((len(lengths), width), pad_value, dtype=np.intp)
+    updates[np.arange(width) < lengths[:, None]] = np.asarray(values, dtype=np.intp)
+    return updates, lengths
+
+
+def find_correctly_ordered(
+    matrix: PrecedenceMatrix, updates: "np.ndarray", assume_total_order: bool = False
+) -> "np.ndarray":
+    """Return a boolean array marking which updates are correctly ordered.
+
+    Args:
+        matrix (PrecedenceMatrix): The ordering rules
+        updates (np.ndarray): Matrix indices of the pages of each update,
+        padded with `matrix.pad_index` by `pad_updates`
+        assume_total_order (bool): If True, only check consecutive pairs of
+        pages. This is exact when there is a rule between every pair of pages
+        in each update (as in the puzzle input); otherwise every pair of pages
+        is checked.
+    """
+    correct = np.ones(len(updates), dtype=bool)
+    max_gap = 1 if assume_total_order else updates.shape[1] - 1
+    for gap in range(1, max_gap + 1):
+        # A later page that must come before an earlier one breaks a rule
+        correct &= ~matrix.cells[updates[:, gap:], updates[:, :-gap]].any(axis=1)
+    return correct
+
+
+def middle_positions_of_reordered(
+    matrix: PrecedenceMatrix, updates: "np.ndarray", lengths: "np.ndarray"
+) -> "np.ndarray":
+    """Return the position in each update of the page that is in the middle
+    once the update is put in order. There must be a rule between every pair
+    of pages in each update.
+
+    The page in the middle is the one with as many pages before it as after
+    it, so each page's position is found by counting the pages of the update
+    that must precede it. Raises a ValueError if an update has no such page.
+
+    Args:
+        matrix (PrecedenceMatrix): The ordering rules
+        updates (np.ndarray): Padded matrix indices, as for
+        `find_correctly_ordered`
+        lengths (np.ndarray): Length of each update
+    """
+    positions = np.empty(len(updates), dtype=np.intp)
+    width = updates.shape[1]
+    batch_size = max(1, REORDER_BUDGET_BYTES // max(1, width * width))
+    for start in range(0, len(updates), batch_size):
+        stop = start + batch_size
+        batch = updates[start:stop]
+        # n_before[i, j]: pages of update i that must precede its page j
+        n_before = matrix.cells[batch[:, :, None], batch[:, None, :]].sum(axis=1)
+        n_before[batch == matrix.pad_index] = -1
+        is_middle = n_before == ((lengths[start:stop] - 1) // 2)[:, None]
+        if not is_middle.any(axis=1).all():
+            raise ValueError("Rules do not define a total order of every update")
+        positions[start:stop] = is_middle.argmax(axis=1)
+    return positions
+
+
+def solve_with_matrix(filepath: str, assume_total_order: bool = False) -> Tuple[int, int]:
+    """Return the sum of the middle pages of the correctly-ordered updates
+    (part one), and of the incorrectly-ordered updates once reordered (part
+    two).
+
+    Args:
+        filepath (str): Path to the puzzle input
+        assume_total_order (bool): Passed to `find_correctly_ordered`
+    """
+    first_pages, second_pages, offsets, pages = cache.cached_parse(
+        filepath, "day05.rules_and_updates", parse_input
+    )
+    matrix = PrecedenceMatrix(first_pages, second_pages)
+
+    if np is None:
+        part_one = part_two = 0
+        for page_list in cache.from_ragged(offsets, pages):
+            if matrix.is_correctly_ordered(page_list):
+                part_one += page_list[(len(page_list) - 1) // 2]
+            else:
+                part_two += matrix.middle_of_reordered(page_list)
+        return part_one, part_two
+
+    offsets = np.asarray(offsets, dtype=np.intp)
+    pages = np.asarray(pages, dtype=np.int64)
+    updates, lengths = pad_updates(offsets, matrix.indices(pages), matrix.pad_index)
+    starts = offsets[:-1]
+    correct = find_correctly_ordered(matrix, updates, assume_total_order)
+    part_one = int(pages[starts[correct] + (lengths[correct] - 1) // 2].sum())
+    incorrect = ~correct
+    positions = middle_positions_of_reordered(matrix, updates[incorrect], lengths[incorrect])
+    part_two = int(pages[starts[incorrect] + positions].sum())
+    return part_one, part_two
@@ -3,17 +3,23 @@ Solution for Advent of Code 2024, day 5.
 """
 
 from dataclasses import dataclass
-from typing import List
+from typing import Dict, Iterable, List, Sequence, Set, Tuple, Union
 
-from advent_of_code.util import file_contents_as_string, print_output_string
+from advent_of_code import cache
+from advent_of_code.day05.topological import middle_page, topological_sort
+from advent_of_code.util import InputData, print_output_string
 
 INPUT_FILEPATH = "advent_of_code/day05/input_day05.txt"
 INPUT_FILEPATH_SMALL = "advent_of_code/day05/input_day05_small.txt"
 
+MERGE_SORT_ENGINE = "merge_sort"
+TOPOLOGICAL_ENGINE = "topological"
+QUICKSELECT_ENGINE = "quickselect"
+
 
 def main() -> None:
     """Compute and print the solution to Advent of Code 2024, day 5."""
-    problem_input = ProblemInput(file_contents_as_string(INPUT_FILEPATH))
+    problem_input = ProblemInput.from_file(INPUT_FILEPATH)
 
     print_output_string(5, 1)
     print(problem_input.solve_part_one())
@@ -22,6 +28,16 @@ def main() -> None:
     print(problem_input.solve_part_two())
 
 
+def part_one() -> int:
+    """Return the answer to part one."""
+    return ProblemInput.from_file(INPUT_FILEPATH).solve_part_one()
+
+
+def part_two() -> int:
+    """Return the answer to part two."""
+    return ProblemInput.from_file(INPUT_FILEPATH).solve_part_two()
+
+
 @dataclass
 class OrderingRule:
     """A page ordering rule. Indicates that the `first_page` must be printed
@@ -41,10 +57,67 @@ class OrderingRule:
         return (self.first_page == target) or (self.second_page == target)
 
 
+class OrderingRuleIndex:
+    """Index of page ordering rules, so that checking whether one page must be
+    printed before another is O(1).
+    """
+
+    def __init__(self, ordering_rules: Iterable[OrderingRule] = ()):
+        # (first_page, second_page) of every rule
+        self.pairs: Set[Tuple[int, int]] = set()
+        # Pages that must be printed after each page
+        self.successors: Dict[int, Set[int]] = {}
+        for rule in ordering_rules:
+            self.add(rule)
+
+    def __len__(self):
+        return len(self.pairs)
+
+    def add(self, rule: OrderingRule) -> None:
+        """Add an ordering rule to the index."""
+        self.pairs.add((rule.first_page, rule.second_page))
+        self.successors.setdefault(rule.first_page, set()).add(rule.second_page)
+
+    def discard(self, rule: OrderingRule) -> None:
+        """Remove an ordering rule from the index, if it is present."""
+        self.pairs.discard((rule.first_page, rule.second_page))
+        successors = self.successors.get(rule.first_page)
+        if successors is not None:
+            successors.discard(rule.second_page)
+            if not successors:
+                del self.successors[rule.first_page]
+
+    def must_precede(self, a: int, b: int) -> bool:
+        """Return True if there is a rule that page `a` must be printed before
+        page `b`, False otherwise.
+        """
+        return (a, b) in self.pairs
+
+    def is_correctly_ordered(self, page_list: List[int]) -> bool:
+        """Return True if the page list follows every rule, False otherwise.
+
+        Equivalent to `PageList._follows_all_rules`, in a single pass over the
+        page list plus a lookup per successor of each page.
+        """
+        # Position of the first occurrence of each page
+        positions: Dict[int, int] = {}
+        for idx, page in enumerate(page_list):
+            positions.setdefault(page, idx)
+        for page, idx in positions.items():
+            for successor in self.successors.get(page, ()):
+                successor_idx = positions.get(successor)
+                if successor_idx is not None and successor_idx < idx:
+                    return False
+        return True
+
+
+OrderingRules = Union[List[OrderingRule], OrderingRuleIndex]
+
+
 class PageList:
     """Pages to print in a given update."""
 
-    def __init__(self, page_list: List[int], ordering_rules: List[OrderingRule]):
+    def __init__(self, page_list: List[int], ordering_rules: OrderingRules):
         self.page_list: List[int] = page_list
         self.in_correct_order: bool = self._follows_all_rules(ordering_rules)
 
@@ -66,10 +139,12 @@ class PageList:
         self.page_list[first_index] = self.page_list[second_index]
         self.page_list[second_index] = temp
 
-    def _follows_all_rules(self, all_ordering_rules: List[OrderingRule]) -> bool:
+    def _follows_all_rules(self, all_ordering_rules: OrderingRules) -> bool:
         """Return True if this PageList follows all specified ordering rules,
         False otherwise.
         """
+        if isinstance(all_ordering_rules, OrderingRuleIndex):
+            return all_ordering_rules.is_correctly_ordered(self.page_list)
         for rule in all_ordering_rules:
             if not self._follows_rule(rule):
                 return False
@@ -96,11 +171,25 @@ class PageList:
 class ProblemInput:
     """Represents a problem input for Advent of Code 2024, day 5."""
 
-    def __init__(self, file_contents: str):
+    def __init__(self, file_contents: str = ""):
         self.ordering_rules: List[OrderingRule] = []
+        self.rule_index = OrderingRuleIndex()
         self.page_lists: List[PageList] = []
         # Call other functions to initialise the values of properties
-        self._init_all(file_contents)
+        if file_contents:
+            self._init_all(file_contents)
+
+    @classmethod
+    def from_file(cls, filepath: str) -> "ProblemInput":
+        """Load the problem input at `filepath`, reusing the parsed input from
+        a previous run if it is cached.
+        """
+        first_pages, second_pages, offsets, pages = cache.cached_parse(
+            filepath, "day05.rules_and_updates", parse_input
+        )
+        problem_input = cls()
+        problem_input._init_from_parsed(first_pages, second_pages, offsets, pages)
+        return problem_input
 
     def solve_part_one(self):
         """Add up the middle page number from each correctly-ordered page list,
@@ -112,15 +201,30 @@ class ProblemInput:
                 output += page_list.get_middle_item()
         return output
 
-    def solve_part_two(self):
+    def solve_part_two(self, engine: str = MERGE_SORT_ENGINE):
         """Add up the middle page numbers after correctly ordering the
         incorrectly-ordered updates, and return the result.
+
+        Args:
+            engine (str): MERGE_SORT_ENGINE to order each update with a merge
+            sort, TOPOLOGICAL_ENGINE to order it with a topological sort of
+            the rules between its pages, or QUICKSELECT_ENGINE to find the
+            middle page without ordering the whole update
         """
+        if engine not in (MERGE_SORT_ENGINE, TOPOLOGICAL_ENGINE, QUICKSELECT_ENGINE):
+            raise ValueError(f"Unknown engine: {engine}")
+        successors = self.rule_index.successors
         output = 0
 
         for page_list in self.page_lists:
-            if not page_list.in_correct_order:
-                sorted_page_list = merge_sort_page_list(page_list.page_list, self.ordering_rules)
+            if page_list.in_correct_order:
+                continue
+            if engine == QUICKSELECT_ENGINE:
+                output += middle_page(page_list.page_list, successors)
+            elif engine == TOPOLOGICAL_ENGINE:
+                output += get_middle(topological_sort(page_list.page_list, successors))
+            else:
+                sorted_page_list = merge_sort_page_list(page_list.page_list, self.rule_index)
                 output += get_middle(sorted_page_list)
 
         return output
@@ -150,6 +254,20 @@ class ProblemInput:
         self._init_ordering_rules(input_file_contents)
         self._init_page_lists(input_file_contents)
 
+    def _init_from_parsed(
+        self,
+        first_pages: Sequence[int],
+        second_pages: Sequence[int],
+        offsets: Sequence[int],
+        pages: Sequence[int],
+    ) -> None:
+        """Initialise from the output of `parse_input`."""
+        for first_page, second_page in zip(first_pages, second_pages):
+            self.ordering_rules.append(OrderingRule(first_page, second_page))
+        self.rule_index = OrderingRuleIndex(self.ordering_rules)
+        for a_list in cache.from_ragged(offsets, pages):
+            self.page_lists.append(PageList(a_list, self.rule_index))
+
     def _init_ordering_rules(self, input_file_contents: str) -> None:
         """Extract the list of page ordering rules from the contents of the
         input file.
@@ -158,6 +276,7 @@ class ProblemInput:
         for rule in ordering_rules_as_strs:
             [first_page, second_page] = rule.split("|")
             self.ordering_rules.append(OrderingRule(int(first_page), int(second_page)))
+        self.rule_index = OrderingRuleIndex(self.ordering_rules)
 
     def _init_page_lists(self, input_file_contents: str) -> None:
         """Given the input file contents, extract the list of pages to produce
@@ -168,10 +287,34 @@ class ProblemInput:
         page_lists_as_strs = (input_file_contents.split("\n\n")[1]).split("\n")
         for a_list in page_lists_as_strs:
             self.page_lists.append(
-                PageList(string_list_to_ints(a_list.split(",")), self.ordering_rules)
+                PageList(string_list_to_ints(a_list.split(",")), self.rule_index)
             )
 
 
+def parse_input(input_data: InputData) -> List[List[int]]:
+    """Parse the input into the first pages of each rule, the second pages of
+    each rule, and the pages of each update (flattened as by `cache.to_ragged`).
+
+    Only reads the numbers; the updates are not checked against the rules.
+    """
+    rules_section, _, updates_section = input_data.text().partition("\n\n")
+    first_pages: List[int] = []
+    second_pages: List[int] = []
+    for line in rules_section.split("\n"):
+        if line:
+            first_page, second_page = line.split("|")
+            first_pages.append(int(first_page))
+            second_pages.append(int(second_page))
+
+    offsets = [0]
+    pages: List[int] = []
+    for line in updates_section.split("\n"):
+        if line:
+            pages.extend(map(int, line.split(",")))
+            offsets.append(len(pages))
+    return [first_pages, second_pages, offsets, pages]
+
+
 def string_list_to_ints(string_list: List) -> List:
     """Convert a list of strings to a list of integers and return."""
     output = []
@@ -180,7 +323,7 @@ def string_list_to_ints(string_list: List) -> List:
     return output
 
 
-def merge_sort_page_list(a_list: List[int], ordering_rules: List[OrderingRule]):
+def merge_sort_page_list(a_list: List[int], ordering_rules: OrderingRules):
     # Base case. A list of zero or one elements is sorted, by definition.
     if len(a_list) <= 1:
         return a_list
@@ -199,7 +342,7 @@ def split_list_in_half(a_list: List[int]):
     return a_list[:half_list_size], a_list[half_list_size:]
 
 
-def merge_page_list(left: List[int], right: List[int], ordering_rules: List[OrderingRule]):
+def merge_page_list(left: List[int], right: List[int], ordering_rules: OrderingRules):
     result = []
     while len(left) > 0 and len(right) > 0:
         if should_occur_before(left[0], right[0], ordering_rules):
@@ -218,10 +361,12 @@ def merge_page_list(left: List[int], right: List[int], ordering_rules: List[Orde
     return result
 
 
-def should_occur_before(a: int, b: int, ordering_rules: List[OrderingRule]):
+def should_occur_before(a: int, b: int, ordering_rules: OrderingRules):
     """Return True if `a` should appear before `b` based on the given
     OrderingRules, False otherwise.
     """
+    if isinstance(ordering_rules, OrderingRuleIndex):
+        return ordering_rules.must_precede(a, b)
     for ordering_rule in ordering_rules:
         if ordering_rule.contains(a) and ordering_rule.contains(b):
             return a == ordering_rule.first_page
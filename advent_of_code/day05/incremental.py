@@ -0,0 +1,104 @@
+"""Incremental print queue for Advent of Code 2024, day 5.
+
+Ordering rules and updates can be added (and rules removed) one at a time,
+while the answers to both parts are kept up to date. An inverted index from
+each page to the updates that contain it means that changing a rule only
+re-evaluates the updates containing both of its pages, since the rule does not
+apply to any other update.
+"""
+
+from typing import Dict, List, Set
+
+from advent_of_code.day05 import day05
+
+
+class IncrementalPrintQueue:
+    """Ordering rules and updates, with running totals for both parts.
+
+    The totals always equal what `ProblemInput.solve_part_one` and
+    `ProblemInput.solve_part_two` would return for the current rules and
+    updates.
+    """
+
+    def __init__(self):
+        self.rule_index = day05.OrderingRuleIndex()
+        # Pages of each update, by update ID
+        self.updates: Dict[int, List[int]] = {}
+        # IDs of the updates containing each page
+        self.updates_with_page: Dict[int, Set[int]] = {}
+        self.in_correct_order: Dict[int, bool] = {}
+        # Middle page of each update, once it is correctly ordered
+        self.middle_pages: Dict[int, int] = {}
+        self.part_one_total = 0
+        self.part_two_total = 0
+        self._next_update_id = 0
+
+    def __len__(self):
+        return len(self.updates)
+
+    def add_rule(self, first_page: int, second_page: int) -> None:
+        """Add the rule that `first_page` must be printed before `second_page`,
+        and update the totals.
+        """
+        rule = day05.OrderingRule(first_page, second_page)
+        if (first_page, second_page) in self.rule_index.pairs:
+            return
+        self.rule_index.add(rule)
+        self._reevaluate_updates_with(rule)
+
+    def remove_rule(self, first_page: int, second_page: int) -> None:
+        """Remove the rule that `first_page` must be printed before
+        `second_page`, if there is one, and update the totals.
+        """
+        rule = day05.OrderingRule(first_page, second_page)
+        if (first_page, second_page) not in self.rule_index.pairs:
+            return
+        self.rule_index.discard(rule)
+        self._reevaluate_updates_with(rule)
+
+    def add_update(self, page_list: List[int]) -> int:
+        """Add an update, update the totals, and return the update's ID."""
+        update_id = self._next_update_id
+        self._next_update_id += 1
+        self.updates[update_id] = list(page_list)
+        for page in set(page_list):
+            self.updates_with_page.setdefault(page, set()).add(update_id)
+        self._evaluate(update_id)
+        return update_id
+
+    def updates_with_rule(self, rule: day05.OrderingRule) -> Set[int]:
+        """Return the IDs of the updates that the rule applies to, i.e. those
+        containing both of its pages.
+        """
+        first = self.updates_with_page.get(rule.first_page, set())
+        second = self.updates_with_page.get(rule.second_page, set())
+        if len(second) < len(first):
+            first, second = second, first
+        return {update_id for update_id in first if update_id in second}
+
+    def _reevaluate_updates_with(self, rule: day05.OrderingRule) -> None:
+        for update_id in self.updates_with_rule(rule):
+            self._withdraw(update_id)
+            self._evaluate(update_id)
+
+    def _evaluate(self, update_id: int) -> None:
+        """Check the order of an update and add its middle page to the
+        appropriate total.
+        """
+        page_list = self.updates[update_id]
+        in_correct_order = self.rule_index.is_correctly_ordered(page_list)
+        if in_correct_order:
+            middle_page = day05.get_middle(page_list)
+            self.part_one_total += middle_page
+        else:
+            middle_page = day05.get_middle(day05.merge_sort_page_list(page_list, self.rule_index))
+            self.part_two_total += middle_page
+        self.in_correct_order[update_id] = in_correct_order
+        self.middle_pages[update_id] = middle_page
+
+    def _withdraw(self, update_id: int) -> None:
+        """Remove an update's middle page from the total it was added to."""
+        if self.in_correct_order[update_id]:
+            self.part_one_total -= self.middle_pages[update_id]
+        else:
+            self.part_two_total -= self.middle_pages[update_id]
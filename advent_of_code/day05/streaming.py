@@ -0,0 +1,62 @@
+"""Streaming solution for Advent of Code 2024, day 5, for inputs with too many
+updates to load at once (or read from stdin).
+
+The ordering rules are read line by line into an `OrderingRuleIndex`, then
+the updates are read line by line and yielded as `PageList`s one at a time.
+Both answers are accumulated in a single pass, so memory use does not grow
+with the number of updates.
+"""
+
+from typing import Iterator, TextIO, Tuple
+
+from advent_of_code.day05 import day05
+
+
+def read_ordering_rules(lines: Iterator[str]) -> day05.OrderingRuleIndex:
+    """Read ordering rules from `lines` up to the blank line that ends them,
+    leaving the remaining lines unread.
+    """
+    rule_index = day05.OrderingRuleIndex()
+    for line in lines:
+        line = line.strip()
+        if not line:
+            break
+        first_page, second_page = line.split("|")
+        rule_index.add(day05.OrderingRule(int(first_page), int(second_page)))
+    return rule_index
+
+
+def iter_page_lists(
+    lines: Iterator[str], rule_index: day05.OrderingRuleIndex
+) -> Iterator[day05.PageList]:
+    """Read updates from `lines`, yielding each one as a PageList checked
+    against `rule_index` as it is read. Blank lines are skipped.
+    """
+    for line in lines:
+        line = line.strip()
+        if line:
+            yield day05.PageList(day05.string_list_to_ints(line.split(",")), rule_index)
+
+
+def solve_stream(stream: TextIO) -> Tuple[int, int]:
+    """Return the sum of the middle pages of the correctly-ordered updates
+    (part one), and of the incorrectly-ordered updates once reordered (part
+    two), reading the input from `stream` in a single pass.
+    """
+    lines = iter(stream)
+    rule_index = read_ordering_rules(lines)
+    part_one_sum = 0
+    part_two_sum = 0
+    for page_list in iter_page_lists(lines, rule_index):
+        if page_list.in_correct_order:
+            part_one_sum += page_list.get_middle_item()
+        else:
+            sorted_page_list = day05.merge_sort_page_list(page_list.page_list, rule_index)
+            part_two_sum += day05.get_middle(sorted_page_list)
+    return part_one_sum, part_two_sum
+
+
+def solve_file(filepath: str) -> Tuple[int, int]:
+    """Same as `solve_stream`, reading from the file at `filepath`."""
+    with open(filepath, encoding="utf-8") as file:
+        return solve_stream(file)
@@ -0,0 +1,132 @@
+"""Reordering engines for Advent of Code 2024, day 5, part 2.
+
+Rather than sorting each update with a comparison sort, build the graph of
+ordering rules between the update's pages and order it with Kahn's algorithm,
+in O(E + V log V). Since part 2 only needs the middle page, `middle_page` can
+also find it with quickselect, without ordering the rest of the update.
+
+Both take the rules as a mapping of each page to the pages that must be
+printed after it, e.g. `OrderingRuleIndex.successors`. Updates are assumed not
+to contain the same page twice.
+"""
+
+import heapq
+import random
+from typing import Dict, List, Mapping, Optional, Set
+
+
+class OrderingCycleError(ValueError):
+    """Raised when the ordering rules between the pages of an update form a
+    cycle, so the pages cannot be put in order.
+    """
+
+    def __init__(self, pages: List[int]):
+        self.pages = pages
+        super().__init__(f"Ordering rules form a cycle between pages {pages}")
+
+
+def induced_successors(
+    page_list: List[int], successors: Mapping[int, Set[int]]
+) -> Dict[int, List[int]]:
+    """Return the rules that apply to the given update, as a mapping of each
+    of its pages to the pages in the update that must be printed after it.
+    """
+    pages = set(page_list)
+    return {page: [other for other in successors.get(page, ()) if other in pages] for page in pages}
+
+
+def topological_sort(page_list: List[int], successors: Mapping[int, Set[int]]) -> List[int]:
+    """Return the pages of the update in an order that follows every rule.
+
+    Whenever several pages could be printed next, the one that comes first
+    in the update is chosen, so an update that already follows every rule is
+    returned unchanged. Raises an OrderingCycleError if the rules between the
+    pages form a cycle.
+    """
+    graph = induced_successors(page_list, successors)
+    in_degree = dict.fromkeys(page_list, 0)
+    for targets in graph.values():
+        for target in targets:
+            in_degree[target] += 1
+    # Position of each page in the update
+    positions = {page: idx for idx, page in enumerate(in_degree)}
+
+    ready = [(positions[page], page) for page in in_degree if in_degree[page] == 0]
+    heapq.heapify(ready)
+    ordered = []
+    while ready:
+        _, page = heapq.heappop(ready)
+        ordered.append(page)
+        for target in graph[page]:
+            in_degree[target] -= 1
+            if in_degree[target] == 0:
+                heapq.heappush(ready, (positions[target], target))
+
+    if len(ordered) < len(in_degree):
+        raise OrderingCycleError(_cycle_pages(graph, in_degree))
+    return ordered
+
+
+def _cycle_pages(graph: Dict[int, List[int]], in_degree: Dict[int, int]) -> List[int]:
+    """Given the state of Kahn's algorithm after it stalls, return the pages
+    that lie on (or between) cycles, in update order.
+    """
+    # Pages never reached have a cycle upstream of them. Drop those that also
+    # have no remaining successors, until only pages on cycles are left.
+    remaining = {page for page, degree in in_degree.items() if degree > 0}
+    out_degree = {page: sum(target in remaining for target in graph[page]) for page in remaining}
+    predecessors: Dict[int, List[int]] = {page: [] for page in remaining}
+    for page in remaining:
+        for target in graph[page]:
+            if target in remaining:
+                predecessors[target].append(page)
+
+    sinks = [page for page in remaining if out_degree[page] == 0]
+    while sinks:
+        page = sinks.pop()
+        remaining.discard(page)
+        for source in predecessors[page]:
+            out_degree[source] -= 1
+            if out_degree[source] == 0:
+                sinks.append(source)
+    return [page for page in in_degree if page in remaining]
+
+
+def middle_page(
+    page_list: List[int], successors: Mapping[int, Set[int]], rng: Optional[random.Random] = None
+) -> int:
+    """Return the page that is in the middle of the update once it is put in
+    order, using quickselect. Takes expected O(n) rule lookups.
+
+    As in the puzzle input, there must be a rule between every pair of pages
+    in the update, otherwise their order (and so the middle page) is not
+    well-defined.
+
+    Args:
+        page_list (List[int]): Pages of the update
+        successors (Mapping[int, Set[int]]): Pages that must be printed after
+        each page
+        rng (Optional[random.Random]): Source of pivot choices
+    """
+    rng = rng or random.Random(0)
+    candidates = list(page_list)
+    # Index of the middle page, among the candidates
+    target = (len(candidates) - 1) // 2
+    while True:
+        pivot = candidates[rng.randrange(len(candidates))]
+        after_pivot = successors.get(pivot, ())
+        before, after = [], []
+        for page in candidates:
+            if page == pivot:
+                continue
+            if page in after_pivot:
+                after.append(page)
+            else:
+                before.append(page)
+        if target < len(before):
+            candidates = before
+        elif target == len(before):
+            return pivot
+        else:
+            target -= len(before) + 1
+            candidates = after
@@ -7,7 +7,8 @@ in their patrol.
 
 from typing import List, TypedDict
 
-from advent_of_code.util import print_output_string
+from advent_of_code import cache
+from advent_of_code.util import InputData, print_output_string
 
 INPUT_FILEPATH = "advent_of_code/day06/input_day06.txt"
 INPUT_FILEPATH_SMALL = "advent_of_code/day06/input_day06_small.txt"
@@ -29,6 +30,20 @@ def main() -> None:
     print(map_area.good_obstacle_positions)
 
 
+def part_one() -> int:
+    """Return the answer to part one."""
+    map_area = MapArea(INPUT_FILEPATH)
+    map_area.traverse()
+    return map_area.unique_visited_positions
+
+
+def part_two() -> int:
+    """Return the answer to part two."""
+    map_area = MapArea(INPUT_FILEPATH)
+    map_area.solve_part_two(False)
+    return map_area.good_obstacle_positions
+
+
 class Position(TypedDict):
     """Represents a position on the map area (row and column)."""
 
@@ -130,16 +145,15 @@ class MapArea:
 
         Should only be called in the __init__() function.
         """
-        with open(
-            filepath,
-            encoding="utf-8",
-        ) as file:
-            for line in file:
-                row = list(line.strip("\n"))
-                self.map_area.append(row)
-                self.original_map_area.append(row)
-
-        self.curr_row, self.curr_col = self.current_position
+        shape, cells = cache.cached_parse(filepath, "day06.map_area", parse_map_area, "qB")
+        n_rows, n_cols, self.curr_row, self.curr_col = shape
+        cells = bytes(cells)
+        for row_idx in range(n_rows):
+            start = row_idx * n_cols
+            stop = start + n_cols
+            row = list(cells[start:stop].decode("utf-8"))
+            self.map_area.append(row)
+            self.original_map_area.append(row)
 
     def reset(self) -> None:
         """Set the map area back to its original state.
@@ -358,3 +372,19 @@ class MapArea:
                     output.append(pos)
         self.reset()
         return output
+
+
+def parse_map_area(input_data: InputData) -> List:
+    """Parse the input into `[n_rows, n_cols, guard_row, guard_col]` and the
+    cells of the map area in row-major order.
+    """
+    grid = input_data.grid()
+    cells = b"".join(grid.rows())
+    guard_positions = [
+        cells.find(val["cursor"].encode("utf-8")) for val in MapArea.guard_direction_data.values()
+    ]
+    guard_positions = [position for position in guard_positions if position != -1]
+    if not guard_positions:
+        raise ValueError("Guard not found")
+    guard_row, guard_col = divmod(min(guard_positions), grid.n_cols)
+    return [[grid.n_rows, grid.n_cols, guard_row, guard_col], cells]
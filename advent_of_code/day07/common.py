@@ -1,15 +1,23 @@
 from typing import List
 
+from advent_of_code import cache
+from advent_of_code.util import InputData
+
 
 def load_input(filepath: str) -> List:
-    output = []
-    with open(
-        filepath,
-        encoding="utf-8",
-    ) as file:
-        for line in file:
-            line_arr = line.split(":")
-            test_val = int(line_arr[0])
-            equation_vals = [int(x) for x in line_arr[1].strip().strip("\n").split(" ")]
-            output.append([test_val, equation_vals])
-    return output
+    test_vals, offsets, values = cache.cached_parse(filepath, "day07.equations", parse_input)
+    equations = cache.from_ragged(offsets, values)
+    return [[test_val, equation_vals] for test_val, equation_vals in zip(test_vals, equations)]
+
+
+def parse_input(input_data: InputData) -> List[List[int]]:
+    """Parse the input into the test values, and the values of each equation
+    (flattened with `cache.to_ragged`).
+    """
+    test_vals = []
+    equations = []
+    for line in input_data.lines():
+        line_arr = line.split(":")
+        test_vals.append(int(line_arr[0]))
+        equations.append([int(x) for x in line_arr[1].strip().split(" ")])
+    return [test_vals, *cache.to_ragged(equations)]
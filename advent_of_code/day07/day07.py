@@ -18,3 +18,13 @@ def main():
     print_output_string(7, 2)
     t = solve_part_two(INPUT_FILEPATH)
     print(t)
+
+
+def part_one() -> int:
+    """Return the answer to part one."""
+    return solve_part_one(INPUT_FILEPATH)
+
+
+def part_two() -> int:
+    """Return the answer to part two."""
+    return solve_part_two(INPUT_FILEPATH)
@@ -1,6 +1,10 @@
 """Utility functions for Advent of code 2024"""
 
+from typing import List, Optional
+
 TEMPLATE_OUTPUT = "Answer to day {0}, part {1}: "
+NEWLINE = ord("\n")
+CARRIAGE_RETURN = ord("\r")
 
 
 def print_output_string(day: int, part: int):
@@ -14,11 +18,129 @@ def file_contents_as_string(filepath: str) -> str:
     Args:
         filepath (str): Path to text file
     """
-    input_str = ""
-    with open(
-        filepath,
-        encoding="utf-8",
-    ) as file:
-        for line in file:
-            input_str += line
-    return input_str
+    return read_input(filepath).text()
+
+
+class ByteGrid:
+    """A rectangular grid of single-byte cells, backed by one flat buffer.
+
+    The cell at (row, col) is stored at `data[row * stride + col]`. The stride
+    includes the line terminator, so rows are views into the original file
+    contents rather than copies.
+    """
+
+    def __init__(self, data: bytes, n_rows: int, n_cols: int, stride: int):
+        self.data = data
+        self.n_rows = n_rows
+        self.n_cols = n_cols
+        self.stride = stride
+
+    def __len__(self):
+        return self.n_rows
+
+    def index(self, row: int, col: int) -> int:
+        """Return the offset of the cell at (row, col) in `self.data`."""
+        return row * self.stride + col
+
+    def get(self, row: int, col: int) -> int:
+        """Return the byte value of the cell at (row, col)."""
+        return self.data[row * self.stride + col]
+
+    def row(self, row: int) -> memoryview:
+        """Return a zero-copy view of a single row, excluding the line
+        terminator.
+        """
+        start = row * self.stride
+        stop = start + self.n_cols
+        return memoryview(self.data)[start:stop]
+
+    def rows(self) -> List[memoryview]:
+        """Return zero-copy views of every row."""
+        return [self.row(row) for row in range(self.n_rows)]
+
+
+class InputData:
+    """The contents of a puzzle input file, read once with a single bulk read.
+
+    Exposes views of the contents in the shapes the daily solutions need:
+    whole text, lines, integer columns and a 2D byte grid.
+    """
+
+    def __init__(self, data: bytes):
+        self.data = data
+        self._text: Optional[str] = None
+
+    @classmethod
+    def from_file(cls, filepath: str) -> "InputData":
+        """Read the file at `filepath` in a single bulk read."""
+        with open(filepath, "rb") as file:
+            return cls(file.read())
+
+    @property
+    def raw(self) -> memoryview:
+        """Return a zero-copy view of the raw file contents."""
+        return memoryview(self.data)
+
+    def text(self) -> str:
+        """Return the file contents as a string, with universal newlines."""
+        if self._text is None:
+            text = self.data.decode("utf-8")
+            if "\r" in text:
+                text = text.replace("\r\n", "\n")
+            self._text = text
+        return self._text
+
+    def lines(self) -> List[str]:
+        """Return each line of the file, without line terminators."""
+        return self.text().splitlines()
+
+    def int_columns(self, n_columns: int) -> List[List[int]]:
+        """Interpret the file as whitespace-separated integers laid out in
+        `n_columns` columns, and return each column as a list.
+
+        Raises a ValueError if the number of integers is not a multiple of
+        `n_columns`.
+        """
+        values = [int(token) for token in self.data.split()]
+        if len(values) % n_columns:
+            raise ValueError(f"Input does not have {n_columns} integer columns")
+        return [values[col::n_columns] for col in range(n_columns)]
+
+    def grid(self) -> ByteGrid:
+        """Interpret the file as a rectangular grid of single-byte cells.
+
+        Trailing blank lines are ignored. Raises a ValueError if the rows are
+        not all the same length.
+        """
+        data = self.data
+        # End of the last row, ignoring any line terminators after it
+        end = len(data)
+        while end and data[end - 1] in (NEWLINE, CARRIAGE_RETURN):
+            end -= 1
+        first_newline = data.find(b"\n", 0, end)
+        if first_newline == -1:
+            return ByteGrid(data, 1 if end else 0, end, end + 1)
+
+        terminator = 1
+        if first_newline > 0 and data[first_newline - 1] == CARRIAGE_RETURN:
+            terminator = 2
+        n_cols = first_newline + 1 - terminator
+        stride = n_cols + terminator
+        # The last row is not followed by a line terminator within `end`
+        size = end + terminator
+        if size % stride:
+            raise ValueError("Input is not a rectangular grid")
+        n_rows = size // stride
+        # Every row must end exactly where the next line terminator is
+        newline_offset = stride - 1
+        if (
+            data.count(b"\n", 0, end) != n_rows - 1
+            or data[newline_offset:end:stride].count(NEWLINE) != n_rows - 1
+        ):
+            raise ValueError("Input is not a rectangular grid")
+        return ByteGrid(data, n_rows, n_cols, stride)
+
+
+def read_input(filepath: str) -> InputData:
+    """Read the puzzle input at `filepath` in a single bulk read."""
+    return InputData.from_file(filepath)